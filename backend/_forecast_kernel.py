@@ -0,0 +1,75 @@
+"""
+LineMind 예측 수치 연산 커널 모듈
+
+SimpleForecaster의 수치 연산 부분(노이즈 생성, 음수 제거, 신뢰구간, 반올림)을
+Numba로 JIT 컴파일하여 파이썬 인터프리터 오버헤드 없이 실행합니다.
+
+Numba가 설치되어 있지 않으면 동일한 코드를 순수 NumPy로 실행합니다.
+난수는 호출자가 전달한 np.random.Generator로 생성하며, Numba도 NumPy와 같은
+알고리즘으로 Generator를 처리하므로 두 경로의 결과는 동일합니다.
+"""
+
+import numpy as np
+from _jit import njit, prange, PARALLEL
+
+
+# cache=True: 컴파일 결과를 디스크에 저장하여 프로세스 재시작 시 재컴파일 방지
+# parallel: 모델별 계산을 prange로 여러 CPU 코어에서 병렬 실행
+# (스레드 안전한 OpenMP 계층을 쓸 수 있을 때만 병렬로 컴파일, _jit 참고)
+@njit(cache=True, parallel=PARALLEL)
+def _forecast_kernel(recent_avg: np.ndarray, periods: int, rng: np.random.Generator):
+    """
+    모델별 이동평균값으로부터 예측값과 신뢰구간을 한 번에 생성합니다.
+
+    난수 생성기는 스레드 간에 공유할 수 없으므로 노이즈 행렬은 먼저 한 번에 생성하고,
+    모델(행)별 계산은 서로 독립적이므로 prange로 병렬 처리합니다.
+
+    Args:
+        recent_avg (np.ndarray): 모델별 최근 이동평균 생산량, shape (M,)
+        periods (int): 예측 기간 (일 단위)
+        rng (np.random.Generator): 노이즈 생성에 사용할 난수 생성기
+
+    Returns:
+        tuple: (예측값, 신뢰구간 하한, 신뢰구간 상한) 정수 배열, 각 shape (M, periods)
+    """
+    n_models = recent_avg.shape[0]
+
+    # 정규분포 노이즈: 평균 0, 표준편차 = recent_avg * 0.1
+    # 모든 모델의 노이즈를 (M, periods) 배열로 한 번에 생성
+    # 이후 연산은 같은 버퍼에서 in-place로 수행하여 임시 배열 할당을 줄임
+    fv = rng.standard_normal((n_models, periods))
+
+    # 세 결과(예측값, 하한, 상한)를 하나의 정수 버퍼에 저장
+    out = np.empty((3, n_models, periods), dtype=np.int32)
+
+    for i in prange(n_models):
+        row = fv[i]
+        row *= recent_avg[i] * 0.1
+        row += recent_avg[i]
+
+        # 음수 제거 (생산량은 0 이상이어야 함)
+        np.maximum(row, 0.0, row)
+
+        # 신뢰구간: 예측값 * 0.8 ~ 예측값 * 1.2
+        # 반올림용 실수 버퍼 하나만 재사용
+        scaled = np.empty_like(row)
+        np.rint(row, scaled)
+        out[0, i] = scaled
+        np.multiply(row, 0.8, scaled)
+        np.rint(scaled, scaled)
+        out[1, i] = scaled
+        np.multiply(row, 1.2, scaled)
+        np.rint(scaled, scaled)
+        out[2, i] = scaled
+
+    return out[0], out[1], out[2]
+
+
+def warmup() -> None:
+    """
+    실제 호출과 같은 인자 타입으로 커널을 한 번 실행하여 JIT 컴파일을 미리 끝냅니다.
+
+    cache=True로 디스크에 저장된 컴파일 결과가 있으면 불러오기만 하므로 빠르며,
+    서버 시작 시 호출하면 첫 예측 요청이 컴파일 시간(수 초)을 기다리지 않습니다.
+    """
+    _forecast_kernel(np.zeros(1, dtype=np.float64), 1, np.random.default_rng(0))
@@ -0,0 +1,32 @@
+"""
+LineMind JIT 컴파일 헬퍼 모듈
+
+수치 연산 커널 모듈(_forecast_kernel, _schedule_kernel)이 공통으로 사용하는 njit 데코레이터와 prange를 제공합니다.
+Numba가 설치되어 있지 않으면 아무 동작도 하지 않는 데코레이터로 대체하여 같은 코드를 순수 NumPy로 실행합니다.
+
+PARALLEL은 병렬 커널(parallel=True)을 안전하게 쓸 수 있는지 나타냅니다.
+커널은 API 스레드 풀에서 동시에 호출되는데, Numba의 기본 workqueue 스레딩 계층은 동시 호출 시
+프로세스를 중단시키므로 스레드 안전한 OpenMP 계층을 사용할 수 있을 때만 병렬로 컴파일합니다.
+(TBB 계층도 스레드 안전하지만 pip로 설치한 tbb는 여러 스레드에서 커널을 호출한 뒤 인터프리터 종료 시 멈춤)
+"""
+
+try:
+    import numba
+    from numba import njit, prange
+
+    try:
+        # OpenMP 런타임(libgomp)이 있으면 스레드 안전한 omp 계층으로 고정
+        from numba.np.ufunc import omppool  # noqa: F401
+        numba.config.THREADING_LAYER = 'omp'
+        PARALLEL = True
+    except (ImportError, OSError):
+        PARALLEL = False
+except ImportError:
+    # Numba 미설치 시 데코레이터를 아무 동작도 하지 않도록 대체하고 prange는 range로 실행
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+    prange = range
+    PARALLEL = False
@@ -12,22 +12,43 @@ LineMind API - FastAPI 백엔드 애플리케이션
 - POST /api/schedule/run: 인력 스케줄링 실행
 """
 
-from fastapi import FastAPI, Body
+from fastapi import FastAPI, Body, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from contextlib import asynccontextmanager
 from data_loader import DataLoader
 from forecast import SimpleForecaster
 from optimizer import StubOptimizer, MilpOptimizer
 from scheduler import StubScheduler, CpsatScheduler
+import _forecast_kernel
+import _schedule_kernel
 import os
 from typing import List, Dict
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    서버 시작/종료 시 실행되는 lifespan 핸들러
+    
+    시작 시 Numba 커널을 미리 컴파일(또는 디스크 캐시에서 로드)하여
+    첫 API 요청이 JIT 컴파일 시간을 기다리지 않도록 합니다.
+    """
+    _forecast_kernel.warmup()
+    _schedule_kernel.warmup()
+    yield
+
+
 # FastAPI 애플리케이션 인스턴스 생성
 # title: API 문서에 표시될 제목
 # version: API 버전 정보
+# default_response_class: 표준 json 대신 orjson(C 구현)으로 응답 직렬화
+# lifespan: 서버 시작 시 Numba 커널 워밍업
 app = FastAPI(
     title="LineMind API",
     version="1.0.0",
-    description="AI 기반 생산 관리 시스템 API"
+    description="AI 기반 생산 관리 시스템 API",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
 # DataLoader 인스턴스 생성
@@ -35,20 +56,32 @@ app = FastAPI(
 data_loader = DataLoader()
 
 # SimpleForecaster 인스턴스 생성
-# 생산량 예측 기능 제공
-forecaster = SimpleForecaster()
+# 생산량 예측 기능 제공 (공유 DataLoader 사용)
+forecaster = SimpleForecaster(data_loader=data_loader)
 
 # Optimizer 선택
 # 환경 변수 USE_MILP=true로 설정하면 MILP 사용, 아니면 Stub 사용
 # 기본값은 MILP 사용 (Phase 2)
+# DataLoader와 Forecaster를 주입하여 CSV/예측 캐시를 하나로 공유
 use_milp = os.getenv('USE_MILP', 'true').lower() == 'true'
-optimizer = MilpOptimizer() if use_milp else StubOptimizer()
+optimizer_class = MilpOptimizer if use_milp else StubOptimizer
+optimizer = optimizer_class(data_loader=data_loader, forecaster=forecaster)
 
 # Scheduler 선택
 # 환경 변수 USE_CPSAT=true로 설정하면 CP-SAT 사용, 아니면 Stub 사용
 # 기본값은 CP-SAT 사용 (Phase 2)
 use_cpsat = os.getenv('USE_CPSAT', 'true').lower() == 'true'
-scheduler = CpsatScheduler() if use_cpsat else StubScheduler()
+scheduler_class = CpsatScheduler if use_cpsat else StubScheduler
+scheduler = scheduler_class(data_loader=data_loader)
+
+
+def get_data_loader() -> DataLoader:
+    """
+    공유 DataLoader를 반환하는 FastAPI 의존성 함수
+    
+    테스트에서는 app.dependency_overrides[get_data_loader]로 다른 DataLoader를 주입할 수 있습니다.
+    """
+    return data_loader
 
 # CORS (Cross-Origin Resource Sharing) 미들웨어 설정
 # 프론트엔드(localhost:3000)에서 백엔드 API를 호출할 수 있도록 허용
@@ -83,8 +116,11 @@ async def health_check():
     }
 
 
+# 아래 엔드포인트들은 pandas/OR-Tools 등 동기(blocking) 연산을 수행하므로
+# async 없이 일반 함수로 정의합니다.
+# FastAPI가 스레드풀에서 실행하여 이벤트 루프가 막히지 않고 동시 요청을 처리할 수 있습니다.
 @app.get("/api/data/status")
-async def data_status():
+def data_status(loader: DataLoader = Depends(get_data_loader)):
     """
     데이터 로딩 상태 확인 엔드포인트
     
@@ -118,7 +154,7 @@ async def data_status():
     """
     try:
         # DataLoader를 사용하여 모든 데이터 로드
-        data = data_loader.load_all_data()
+        data = loader.load_all_data()
         
         # 각 데이터셋의 행 개수 계산
         data_counts = {name: len(df) for name, df in data.items()}
@@ -138,7 +174,7 @@ async def data_status():
 
 
 @app.post("/api/forecast/run")
-async def run_forecast():
+def run_forecast():
     """
     생산량 예측 실행 엔드포인트
     
@@ -183,11 +219,13 @@ async def run_forecast():
     """
     # SimpleForecaster를 사용하여 예측 실행
     # 모든 에러 핸들링은 forecaster 내부에서 처리됨
-    return forecaster.run_forecast_all_models()
+    # 예측 결과는 이미 JSON 직렬화 가능한 형태이므로 ORJSONResponse로 직접 반환하여
+    # FastAPI의 jsonable_encoder 변환 단계를 건너뜀
+    return ORJSONResponse(forecaster.run_forecast_all_models())
 
 
 @app.post("/api/mix/optimize")
-async def run_optimization():
+def run_optimization():
     """
     생산 믹스 최적화 실행 엔드포인트
     
@@ -244,7 +282,7 @@ async def run_optimization():
 
 
 @app.post("/api/schedule/run")
-async def run_scheduling(mix_plan: List[Dict] = Body(...)):
+def run_scheduling(mix_plan: List[Dict] = Body(...)):
     """
     인력 스케줄링 실행 엔드포인트
     
@@ -311,8 +349,10 @@ if __name__ == "__main__":
     import uvicorn
     
     # uvicorn 서버 실행
-    # - app: FastAPI 애플리케이션 인스턴스
+    # - "app:app": app.py 모듈의 FastAPI 애플리케이션 인스턴스
     # - host: 0.0.0.0으로 설정하여 외부 접근 허용
     # - port: 8000번 포트 사용
-    # - reload: 코드 변경 시 자동 재시작 (개발 모드)
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # - workers: 예측/최적화 연산을 여러 CPU 코어에서 병렬 처리하기 위한 프로세스 수
+    #   (workers를 사용하려면 앱을 "모듈:변수" 문자열로 전달해야 함)
+    # - 이벤트 루프는 기본값(auto)으로 uvloop이 설치되어 있으면 자동으로 uvloop 사용
+    uvicorn.run("app:app", host="0.0.0.0", port=8000, workers=4)
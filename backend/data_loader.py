@@ -13,7 +13,30 @@ CSV 파일 기반의 시드 데이터를 로드하고 검증하는 중앙 데이
 
 import pandas as pd
 import os
-from typing import Dict
+from typing import Dict, List, Optional, Tuple
+
+# pyarrow가 설치되어 있으면 멀티스레드 C++ CSV 파서 사용, 없으면 pandas 기본 C 파서 사용
+try:
+    import pyarrow  # noqa: F401
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+
+def _is_blank_file(filepath: str) -> bool:
+    """
+    파일에 공백 문자 외의 내용이 없는지 확인합니다.
+    
+    pandas C 파서는 빈 파일에 EmptyDataError를 던지지만 pyarrow 엔진은 ArrowInvalid를 던지므로,
+    엔진과 관계없이 같은 에러 메시지를 내도록 파싱 전에 직접 확인합니다.
+    내용이 있는 파일은 첫 블록만 읽고 바로 반환합니다.
+    """
+    with open(filepath, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            if chunk.strip():
+                return False
+    return True
+
 
 class DataLoader:
     """
@@ -21,6 +44,9 @@ class DataLoader:
     
     Attributes:
         data_dir (str): CSV 파일이 저장된 디렉토리 경로
+        _cache (dict): 파일 경로를 키로, (수정 시각, 데이터프레임)을 값으로 하는 캐시
+        _sorted_workers (tuple): (원본 작업자 데이터프레임, 연차순 정렬된 작업자 데이터프레임) 캐시
+        generation (int): invalidate()가 호출될 때마다 1씩 증가하는 캐시 세대 번호
     """
     
     def __init__(self, data_dir: str = "data/seed"):
@@ -31,23 +57,57 @@ class DataLoader:
             data_dir (str): CSV 파일이 저장된 디렉토리 경로 (기본값: "data/seed")
         """
         self.data_dir = data_dir
+        
+        # CSV 로드 결과 캐시
+        # 파일 수정 시각(mtime)이 같으면 다시 파싱하지 않고 캐시된 데이터프레임을 반환
+        self._cache: Dict[str, Tuple[float, pd.DataFrame]] = {}
+        
+        # 연차순 정렬된 작업자 레코드 캐시
+        # 원본 데이터프레임이 다시 로드되면(객체가 바뀌면) 다시 정렬
+        self._sorted_workers: Optional[Tuple[pd.DataFrame, pd.DataFrame]] = None
+        
+        # 캐시 세대 번호
+        # 이 로더의 데이터로 결과를 캐시하는 모듈(예: SimpleForecaster)이 캐시 키에 포함하여
+        # 로더 캐시가 비워지면 함께 무효화되도록 함
+        self.generation = 0
+    
+    def invalidate(self):
+        """
+        캐시를 모두 비워 다음 호출 시 CSV 파일을 다시 로드하도록 합니다.
+        
+        파일 수정 시각(mtime)이 바뀌면 자동으로 다시 로드되므로,
+        mtime이 유지된 채 파일이 교체된 경우 등 명시적인 재로드가 필요할 때만 사용합니다.
+        """
+        self._cache.clear()
+        self._sorted_workers = None
+        self.generation += 1
 
     
-    def load_csv(self, filename: str, required_columns: list) -> pd.DataFrame:
+    def load_csv(
+        self,
+        filename: str,
+        required_columns: list,
+        dtypes: Optional[Dict[str, str]] = None,
+        parse_dates: Optional[List[str]] = None
+    ) -> pd.DataFrame:
         """
         CSV 파일을 로드하고 필수 컬럼 및 결측치를 검증합니다.
         
+        파일 수정 시각(mtime)이 이전 로드와 같으면 파싱과 검증을 건너뛰고
+        캐시된 데이터프레임을 반환합니다. 반환된 데이터프레임은 공유되므로 수정하지 마세요.
+        
         Args:
             filename (str): 로드할 CSV 파일명 (예: "production_history.csv")
             required_columns (list): 필수로 존재해야 하는 컬럼 리스트
+            dtypes (dict, optional): 컬럼명을 키로, 변환할 dtype을 값으로 하는 딕셔너리
+            parse_dates (list, optional): datetime으로 변환할 날짜 컬럼 리스트
         
         Returns:
             pd.DataFrame: 로드된 데이터프레임
         
         Raises:
             FileNotFoundError: CSV 파일이 존재하지 않을 때
-            ValueError: 필수 컬럼이 누락되었거나 결측치가 있을 때
-            pd.errors.EmptyDataError: CSV 파일이 비어있을 때
+            ValueError: CSV 파일이 비어있거나, 필수 컬럼이 누락되었거나, 결측치가 있을 때
         
         Example:
             >>> loader = DataLoader()
@@ -60,21 +120,42 @@ class DataLoader:
         if not os.path.exists(filepath):
             raise FileNotFoundError(f"CSV 파일이 없습니다: {filepath}")
         
+        # 2. 캐시 확인
+        # 파일이 변경되지 않았으면 캐시된 데이터프레임 반환
+        mtime = os.path.getmtime(filepath)
+        cached = self._cache.get(filepath)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
         try:
-            # 2. CSV 파일 로드
-            df = pd.read_csv(filepath)
+            # 3. CSV 파일 로드
+            # 빈 파일은 파싱 엔진에 따라 다른 예외가 나므로 파싱 전에 확인
+            if _is_blank_file(filepath):
+                raise pd.errors.EmptyDataError("No columns to parse from file")
+            df = pd.read_csv(filepath, engine=CSV_ENGINE)
             
-            # 3. 필수 컬럼 검증
-            # 필수 컬럼 중 데이터프레임에 없는 컬럼 찾기
-            missing_cols = [col for col in required_columns if col not in df.columns]
+            # 4. 필수 컬럼 검증
+            # 필수 컬럼 중 데이터프레임에 없는 컬럼 찾기 (set으로 O(1) 조회, 에러 메시지는 원래 순서 유지)
+            existing_cols = set(df.columns)
+            missing_cols = [col for col in required_columns if col not in existing_cols]
             if missing_cols:
                 raise ValueError(f"필수 컬럼이 없습니다: {missing_cols}")
             
-            # 4. 결측치(NA) 검증
+            # 5. 결측치(NA) 검증
             # 필수 컬럼에 결측치가 있는지 확인
-            if df[required_columns].isnull().any().any():
+            # 중간 Series 없이 NumPy 배열 전체에 대해 한 번에 any() 수행
+            if df[required_columns].isna().to_numpy().any():
                 raise ValueError(f"데이터에 결측치가 있습니다")
             
+            # 6. 컬럼 타입 지정
+            # 검증 이후에 변환하여 누락/결측치 에러 메시지가 변환 에러에 가려지지 않도록 함
+            if dtypes:
+                df = df.astype(dtypes)
+            for col in parse_dates or []:
+                df[col] = pd.to_datetime(df[col])
+            
+            # 7. 검증을 통과한 데이터만 캐시에 저장
+            self._cache[filepath] = (mtime, df)
             return df
             
         except pd.errors.EmptyDataError:
@@ -111,31 +192,80 @@ class DataLoader:
         # 필수 컬럼: 날짜, 라인ID, 모델, 교대, 생산량
         data['production'] = self.load_csv(
             'production_history.csv',
-            ['date', 'line_id', 'model', 'shift', 'produced_units']
+            ['date', 'line_id', 'model', 'shift', 'produced_units'],
+            # 라인/모델/교대는 고유값이 적으므로 category로 저장하여 비교·groupby를 정수 코드로 처리
+            dtypes={'line_id': 'category', 'model': 'category', 'shift': 'category', 'produced_units': 'int32'},
+            parse_dates=['date']
         )
         
         # 2. 라인 정보 데이터 로드
         # 필수 컬럼: 라인ID, 지원 가능 모델, 일일 기본 생산 용량
         data['lines'] = self.load_csv(
             'lines.csv',
-            ['line_id', 'eligible_models', 'base_daily_capacity']
+            ['line_id', 'eligible_models', 'base_daily_capacity'],
+            dtypes={'line_id': 'category', 'eligible_models': 'str', 'base_daily_capacity': 'int64'}
         )
         
         # 3. 작업자 정보 데이터 로드
-        # 필수 컬럼: 작업자ID, 연차, 시급, 주간 최대 근무 시간
-        data['workers'] = self.load_csv(
-            'workers.csv',
-            ['worker_id', 'years', 'wage_per_hour', 'max_hours_week']
-        )
+        data['workers'] = self.load_workers()
         
         # 4. 체인지오버 비용 데이터 로드
-        # 필수 컬럼: 출발 모델, 도착 모델, 체인지오버 시간, 체인지오버 비용
+        # 필수 컬럼: 라인ID, 출발 모델, 도착 모델, 체인지오버 시간, 체인지오버 비용
         data['costs'] = self.load_csv(
             'cost_params.csv',
-            ['from_model', 'to_model', 'changeover_hours', 'changeover_cost']
+            ['line_id', 'from_model', 'to_model', 'changeover_hours', 'changeover_cost']
         )
         
         return data
+    
+    def load_workers(self) -> pd.DataFrame:
+        """
+        작업자 정보 CSV만 로드합니다.
+        
+        스케줄러처럼 작업자 데이터만 필요한 호출자가 load_all_data로 나머지 CSV까지
+        확인(stat)·검증하지 않도록 분리했습니다. 파일이 변경되지 않았으면 캐시된 데이터프레임을 반환합니다.
+        
+        Returns:
+            pd.DataFrame: 작업자 정보 데이터
+        
+        Raises:
+            FileNotFoundError: CSV 파일이 존재하지 않을 때
+            ValueError: 필수 컬럼이 누락되었거나 결측치가 있을 때
+        """
+        # 필수 컬럼: 작업자ID, 연차, 시급, 주간 최대 근무 시간
+        return self.load_csv(
+            'workers.csv',
+            ['worker_id', 'years', 'wage_per_hour', 'max_hours_week']
+        )
+    
+    def load_workers_by_seniority(self) -> pd.DataFrame:
+        """
+        연차가 높은 순으로 정렬된 작업자 데이터프레임을 반환합니다.
+        
+        작업자 CSV가 변경되지 않았으면 이전에 정렬한 결과를 재사용합니다.
+        레코드(dict) 리스트로 변환하지 않으므로 호출자는 컬럼을 ndarray로 바로 꺼내 쓸 수 있습니다.
+        반환된 데이터프레임은 공유되므로 수정하지 마세요.
+        
+        Returns:
+            pd.DataFrame: 작업자 데이터 (연차 내림차순)
+        
+        Raises:
+            FileNotFoundError: CSV 파일이 존재하지 않을 때
+            ValueError: 필수 컬럼이 누락되었거나 결측치가 있을 때
+        """
+        workers_df = self.load_workers()
+        
+        # 캐시된 정렬 결과가 현재 작업자 데이터프레임으로 만든 것이 아니면 다시 정렬
+        if self._sorted_workers is None or self._sorted_workers[0] is not workers_df:
+            sorted_df = workers_df.sort_values('years', ascending=False)
+            self._sorted_workers = (workers_df, sorted_df)
+        
+        return self._sorted_workers[1]
+
+
+# 모듈 공용 DataLoader 인스턴스
+# 의존성을 주입하지 않은 모든 모듈이 이 인스턴스(와 CSV 캐시)를 공유
+_default_loader = DataLoader()
 
 
 def test_data_loading():
@@ -13,8 +13,10 @@ Phase 1에서는 이동평균을 사용하고, Phase 2에서는 Prophet 또는 A
 
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
-from data_loader import DataLoader
+import os
+from data_loader import DataLoader, _default_loader
+from _forecast_kernel import _forecast_kernel
+from typing import Optional, Tuple
 
 
 class SimpleForecaster:
@@ -23,113 +25,43 @@ class SimpleForecaster:
     
     Attributes:
         data_loader (DataLoader): CSV 데이터를 로드하는 DataLoader 인스턴스
+        _forecast_cache (tuple): (생산 이력 CSV 수정 시각, DataLoader 캐시 세대 번호, 예측 기간, 예측 결과 배열) 캐시
     """
     
-    def __init__(self):
+    def __init__(self, data_loader: Optional[DataLoader] = None):
         """
         SimpleForecaster 초기화
         
-        DataLoader 인스턴스를 생성하여 생산 이력 데이터에 접근할 수 있도록 합니다.
-        """
-        self.data_loader = DataLoader()
-
-    
-    def moving_average_forecast(self, df: pd.DataFrame, model: str, periods: int = 30) -> pd.DataFrame:
-        """
-        특정 모델에 대한 이동평균 기반 예측을 생성합니다.
-        
-        알고리즘:
-        1. 해당 모델의 과거 생산 데이터 필터링
-        2. 날짜별 총 생산량 계산 (여러 교대의 합계)
-        3. 최근 7일 이동평균 계산
-        4. 정규분포 노이즈 추가 (표준편차 = 평균 * 0.1)
-        5. 신뢰구간 계산 (예측값 * 0.8 ~ 예측값 * 1.2)
+        DataLoader 인스턴스를 주입받아 생산 이력 데이터에 접근할 수 있도록 합니다.
         
         Args:
-            df (pd.DataFrame): 생산 이력 데이터프레임
-            model (str): 예측할 모델명 (예: "ModelA")
-            periods (int): 예측 기간 (일 단위, 기본값: 30일)
-        
-        Returns:
-            pd.DataFrame: 예측 결과 데이터프레임
-                - date: 예측 날짜
-                - model: 모델명
-                - forecast_units: 예측 생산량
-                - conf_lo: 신뢰구간 하한 (예측값 * 0.8)
-                - conf_hi: 신뢰구간 상한 (예측값 * 1.2)
-        
-        Example:
-            >>> forecaster = SimpleForecaster()
-            >>> data = forecaster.data_loader.load_all_data()
-            >>> forecast_df = forecaster.moving_average_forecast(data['production'], 'ModelA', 30)
+            data_loader (DataLoader, optional): 사용할 DataLoader (기본값: 모듈 공용 인스턴스)
         """
-        # 1. 해당 모델의 데이터만 필터링
-        model_data = df[df['model'] == model].copy()
+        self.data_loader = data_loader if data_loader is not None else _default_loader
         
-        # 2. 과거 데이터가 없는 경우 기본값 반환
-        if len(model_data) == 0:
-            # 현재 날짜부터 periods일간의 날짜 생성
-            dates = pd.date_range(datetime.now(), periods=periods, freq='D')
-            
-            # 기본값 100 units/day로 예측 생성
-            return pd.DataFrame({
-                'date': dates,
-                'model': model,
-                'forecast_units': [100] * periods,  # 기본 예측값
-                'conf_lo': [80] * periods,          # 하한 (100 * 0.8)
-                'conf_hi': [120] * periods          # 상한 (100 * 1.2)
-            })
-        
-        # 3. 날짜별 총 생산량 계산
-        # 같은 날짜에 여러 교대(Day, Night)가 있을 수 있으므로 합산
-        daily_production = model_data.groupby('date')['produced_units'].sum()
-        
-        # 4. 최근 7일 이동평균 계산
-        # 데이터가 7일 미만이면 가능한 모든 데이터 사용
-        window_size = min(7, len(daily_production))
-        recent_avg = daily_production.tail(window_size).mean()
-        
-        # 5. 미래 날짜 생성
-        # 마지막 생산 날짜 다음날부터 periods일간
-        last_date = pd.to_datetime(daily_production.index[-1])
-        future_dates = pd.date_range(
-            last_date + timedelta(days=1),
-            periods=periods,
-            freq='D'
-        )
-        
-        # 6. 예측값 생성 (이동평균 + 정규분포 노이즈)
-        # 재현 가능한 결과를 위해 시드 고정
-        np.random.seed(42)
-        
-        # 정규분포 노이즈: 평균 0, 표준편차 = recent_avg * 0.1
-        noise = np.random.normal(0, recent_avg * 0.1, periods)
-        forecast_values = recent_avg + noise
-        
-        # 음수 제거 (생산량은 0 이상이어야 함)
-        forecast_values = np.maximum(forecast_values, 0)
-        
-        # 7. 신뢰구간 계산
-        # 하한: 예측값 * 0.8
-        # 상한: 예측값 * 1.2
-        conf_lo = forecast_values * 0.8
-        conf_hi = forecast_values * 1.2
-        
-        # 8. 결과 데이터프레임 생성
-        return pd.DataFrame({
-            'date': future_dates,
-            'model': model,
-            'forecast_units': forecast_values.round().astype(int),
-            'conf_lo': conf_lo.round().astype(int),
-            'conf_hi': conf_hi.round().astype(int)
-        })
+        # 예측 결과 캐시
+        # 예측은 시드가 고정되어 있어 생산 이력이 같으면 결과도 같으므로
+        # 생산 이력 CSV의 수정 시각(mtime), DataLoader 캐시 세대 번호, 예측 기간이 같으면 캐시된 결과를 사용
+        self._forecast_cache: Optional[Tuple[float, int, int, tuple]] = None
+    
+    def invalidate(self):
+        """
+        예측 결과 캐시와 DataLoader 캐시를 비워 다음 호출 시 다시 계산하도록 합니다.
+        """
+        self._forecast_cache = None
+        self.data_loader.invalidate()
 
     
-    def run_forecast_all_models(self) -> dict:
+    def run_forecast_all_models(self, periods: int = 30) -> dict:
         """
         모든 모델에 대한 예측을 실행합니다.
         
-        생산 이력 데이터에서 모든 고유 모델을 찾아 각각에 대해 30일 예측을 생성합니다.
+        생산 이력 데이터에서 모든 고유 모델을 찾아 periods일 예측을 생성합니다.
+        한 번의 groupby로 모든 모델의 이동평균을 구한 뒤 (모델 수, 예측 기간) 배열로 노이즈를 한 번에 생성합니다.
+        생산 이력 CSV가 변경되지 않았고 예측 기간이 같으면 캐시된 예측 결과로 응답만 새로 만들어 반환합니다.
+        
+        Args:
+            periods (int): 예측 기간 (일 단위, 기본값: 30일)
         
         Returns:
             dict: 예측 결과 딕셔너리
@@ -149,6 +81,16 @@ class SimpleForecaster:
             >>>         print(f"{model}: {len(forecast)}일 예측")
         """
         try:
+            # 0. 캐시 확인
+            # 생산 이력 CSV가 변경되지 않았고 예측 기간이 같으면 캐시된 예측 결과 반환
+            production_path = os.path.join(self.data_loader.data_dir, 'production_history.csv')
+            # 파일이 없으면 DataLoader가 명확한 에러 메시지를 반환하도록 캐시 확인을 건너뜀
+            mtime = os.path.getmtime(production_path) if os.path.exists(production_path) else None
+            # DataLoader 캐시가 비워지면(invalidate) 세대 번호가 바뀌므로 예측 캐시도 함께 무효화됨
+            generation = self.data_loader.generation
+            if mtime is not None and self._forecast_cache is not None and self._forecast_cache[:3] == (mtime, generation, periods):
+                return self._build_response(self._forecast_cache[3])
+            
             # 1. 모든 데이터 로드
             data = self.data_loader.load_all_data()
             production_df = data['production']
@@ -156,23 +98,66 @@ class SimpleForecaster:
             # 2. 생산 이력에서 고유 모델 목록 추출
             models = production_df['model'].unique()
             
-            # 3. 각 모델에 대해 예측 실행
-            forecasts = {}
-            for model in models:
-                # 예측 실행
-                forecast_df = self.moving_average_forecast(production_df, model)
-                
-                # 데이터프레임을 딕셔너리 리스트로 변환
-                # 날짜를 문자열로 변환하여 JSON 직렬화 가능하도록 함
-                forecast_df['date'] = forecast_df['date'].dt.strftime('%Y-%m-%d')
-                forecasts[model] = forecast_df.to_dict('records')
+            # 3. 집계에 필요한 컬럼을 NumPy 배열로 꺼냄
+            # model은 category 타입이므로 문자열 대신 정수 코드로 그룹화
+            # 배열은 DataLoader가 캐시한 데이터프레임의 뷰이므로 복사가 없고, 모델별 마스크 대신
+            # 모든 모델을 한 번에 집계하므로 모델 수만큼 전체 행을 다시 훑지 않음
+            model_col = production_df['model']
+            codes = model_col.cat.codes.to_numpy()
+            dates = production_df['date'].to_numpy()
+            produced = production_df['produced_units'].to_numpy()
+            model_codes = model_col.cat.categories.get_indexer(models)
             
-            # 4. 성공 응답 반환
-            return {
-                "status": "success",
-                "forecasts": forecasts,
-                "message": f"{len(models)}개 모델 예측 완료"
-            }
+            # 4. 모델별 마지막 생산 날짜 (코드로 인덱싱하는 배열)
+            last = pd.Series(dates).groupby(codes).max()
+            last_by_code = np.full(len(model_col.cat.categories), np.datetime64('NaT'), dtype=dates.dtype)
+            last_by_code[last.index.to_numpy()] = last.to_numpy()
+            
+            # 5. 모델별 최근 구간의 행만 남긴 뒤 날짜별 총 생산량 계산
+            # 전체 이력을 (모델, 날짜)로 groupby하지 않고, 모델별 마지막 생산 날짜부터 6일 전까지(달력 7일)의
+            # 행만 골라 집계 (같은 날짜에 여러 교대(Day, Night)가 있을 수 있으므로 합산)
+            recent = dates >= last_by_code[codes] - np.timedelta64(6, 'D')
+            daily = pd.Series(produced[recent]).groupby([codes[recent], dates[recent]]).sum()
+            
+            # 생산하지 않은 날이 있는 모델은 달력 7일 안의 생산일이 7일보다 적을 수 있으므로
+            # 해당 모델만 전체 이력에서 다시 집계 (이력이 7일 미만이면 가능한 모든 데이터 사용)
+            days_per_model = daily.groupby(level=0).size()
+            sparse = days_per_model.index[days_per_model < 7].to_numpy()
+            if len(sparse):
+                in_sparse = np.isin(codes, sparse)
+                sparse_daily = pd.Series(produced[in_sparse]).groupby([codes[in_sparse], dates[in_sparse]]).sum()
+                daily = pd.concat([daily.drop(sparse, level=0), sparse_daily])
+            
+            # 6. 모델별 최근 7일 이동평균
+            # 모델별로 날짜 순으로 정렬되어 있으므로 tail(7)이 최근 7개 생산일
+            recent_avg = daily.groupby(level=0).tail(7).groupby(level=0).mean().reindex(model_codes)
+            last_dates = last_by_code[model_codes]
+            
+            # 7. 모든 모델의 예측값 및 신뢰구간을 한 번에 생성
+            # 재현 가능한 결과를 위해 시드 고정
+            rng = np.random.default_rng(42)
+            forecast_units, conf_lo, conf_hi = _forecast_kernel(
+                recent_avg.to_numpy(dtype=np.float64), periods, rng
+            )
+            
+            # 8. 예측 날짜 라벨 생성
+            # 예측 날짜는 마지막 생산 날짜 다음날부터 periods일간이며, 마지막 생산 날짜가 같은 모델들은
+            # 날짜 문자열을 공유하도록 고유한 마지막 날짜마다 한 번만 생성
+            # 날짜를 문자열로 변환하여 JSON 직렬화 가능하도록 함
+            unique_last, last_idx = np.unique(last_dates, return_inverse=True)
+            offsets = np.arange(1, periods + 1).astype('timedelta64[D]')
+            date_labels = tuple(
+                tuple(np.datetime_as_string(last + offsets, unit='D').tolist())
+                for last in unique_last
+            )
+            
+            # 9. 예측 결과 배열을 읽기 전용으로 캐시에 저장한 뒤 응답 생성
+            # 응답 딕셔너리는 호출자가 수정할 수 있으므로 캐시하지 않고 호출마다 새로 만듦
+            for arr in (last_idx, forecast_units, conf_lo, conf_hi):
+                arr.flags.writeable = False
+            forecast = (tuple(models), date_labels, last_idx, forecast_units, conf_lo, conf_hi)
+            self._forecast_cache = (mtime, generation, periods, forecast)
+            return self._build_response(forecast)
             
         except Exception as e:
             # 에러 발생 시 에러 응답 반환
@@ -181,6 +166,51 @@ class SimpleForecaster:
                 "message": str(e)
             }
 
+    
+    @staticmethod
+    def _build_response(forecast: tuple) -> dict:
+        """
+        캐시된 예측 결과 배열로 성공 응답 딕셔너리를 만듭니다.
+        
+        NumPy 배열을 tolist()로 한 번에 파이썬 값으로 변환하며, 호출마다 새 딕셔너리와 리스트를 반환합니다.
+        
+        Args:
+            forecast (tuple): (모델 목록, 고유 마지막 날짜별 예측 날짜 라벨, 모델별 라벨 인덱스,
+                예측값, 신뢰구간 하한, 신뢰구간 상한)
+        
+        Returns:
+            dict: run_forecast_all_models의 성공 응답
+        """
+        models, date_labels, last_idx, forecast_units, conf_lo, conf_hi = forecast
+        forecasts = {}
+        for i, model in enumerate(models):
+            forecasts[model] = [
+                {
+                    'date': date,
+                    'model': model,
+                    'forecast_units': units,
+                    'conf_lo': lo,
+                    'conf_hi': hi
+                }
+                for date, units, lo, hi in zip(
+                    date_labels[last_idx[i]],
+                    forecast_units[i].tolist(),
+                    conf_lo[i].tolist(),
+                    conf_hi[i].tolist()
+                )
+            ]
+        
+        return {
+            "status": "success",
+            "forecasts": forecasts,
+            "message": f"{len(models)}개 모델 예측 완료"
+        }
+
+
+# 모듈 공용 SimpleForecaster 인스턴스
+# 의존성을 주입하지 않은 최적화 모듈들이 이 인스턴스(와 예측 캐시)를 공유
+_default_forecaster = SimpleForecaster()
+
 
 def test_forecast():
     """
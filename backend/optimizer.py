@@ -12,10 +12,130 @@ Phase 2에서는 OR-Tools MILP를 사용하여 체인지오버 비용과 용량
 - KPI 계산 (총 수요, 계획 생산, 충족률)
 """
 
+import os
 import pandas as pd
-from data_loader import DataLoader
-from forecast import SimpleForecaster
-from typing import Dict, List
+import numpy as np
+from data_loader import DataLoader, _default_loader
+from forecast import SimpleForecaster, _default_forecaster
+from typing import Dict, List, Optional
+
+# OR-Tools는 MILP 최적화에서만 필요하므로 선택적으로 임포트
+# 설치되어 있지 않으면 데이터 로드/예측을 수행하기 전에 바로 에러를 반환
+try:
+    from ortools.sat.python import cp_model
+    _HAS_ORTOOLS = True
+except ImportError:
+    cp_model = None
+    _HAS_ORTOOLS = False
+
+
+def _weekly_demand(forecasts: Dict[str, List[dict]], n_weeks: int) -> np.ndarray:
+    """
+    모델별 일간 예측값을 주 단위 수요 행렬로 집계합니다.
+    
+    앞에서부터 n_weeks * 7일의 예측값을 (모델 수, n_weeks * 7) 행렬에 한 번만 모은 뒤
+    (모델 수, n_weeks, 7)로 바꿔 주 단위로 합산합니다.
+    예측 기간이 집계 기간보다 짧으면 남는 날의 수요는 0으로 계산합니다.
+    
+    Args:
+        forecasts (Dict[str, List[dict]]): 모델별 예측 데이터 (run_forecast_all_models의 forecasts)
+        n_weeks (int): 집계할 주 수
+    
+    Returns:
+        np.ndarray: 주간 수요 행렬, shape (모델 수, n_weeks), forecasts의 모델 순서
+    """
+    n_days = n_weeks * 7
+    daily = np.zeros((len(forecasts), n_days), dtype=np.int64)
+    for mi, forecast in enumerate(forecasts.values()):
+        n = min(len(forecast), n_days)
+        daily[mi, :n] = np.fromiter(
+            (d['forecast_units'] for d in forecast[:n]),
+            dtype=np.int64,
+            count=n
+        )
+    return daily.reshape(len(forecasts), n_weeks, 7).sum(axis=2)
+
+
+def _single_model_plan(weekly: np.ndarray, weekly_cap: np.ndarray, lines_for_model: List[List[int]]):
+    """
+    라인마다 모델 하나를 전 기간 고정 배정하여 모든 주간 수요를 충족하는 계획을 Greedy로 찾습니다.
+    
+    모델별 최대 주간 수요가 큰 순서로, 아직 배정되지 않은 생산 가능 라인을 용량이 큰 순서대로
+    배정합니다. 찾은 계획은 체인지오버가 없고 생산량 합계가 총 수요와 같으므로
+    목적 함수의 하한(1000 * 총 수요)을 달성하는 최적해입니다.
+    
+    Args:
+        weekly (np.ndarray): 주간 수요 행렬, shape (모델 수, 주 수)
+        weekly_cap (np.ndarray): 라인별 주간 최대 생산량, shape (라인 수,)
+        lines_for_model (List[List[int]]): 모델 코드별 생산 가능 라인 코드 리스트
+    
+    Returns:
+        tuple or None: (라인 코드, 모델 코드, 주차, 생산량) 배열 (주차 → 라인 순으로 정렬),
+            Greedy 배정으로 수요를 충족할 수 없으면 None
+    """
+    n_lines = weekly_cap.shape[0]
+    n_weeks = weekly.shape[1]
+    peak = weekly.max(axis=1) if n_weeks > 0 else np.zeros(weekly.shape[0], dtype=np.int64)
+    
+    # 1. 라인별 모델 배정 (-1: 미배정)
+    assigned = np.full(n_lines, -1, dtype=np.int64)
+    for mi in np.argsort(-peak, kind='stable').tolist():
+        if peak[mi] == 0:
+            continue
+        free = [li for li in lines_for_model[mi] if assigned[li] < 0]
+        free.sort(key=lambda li: -weekly_cap[li])
+        covered = 0
+        for li in free:
+            if covered >= peak[mi]:
+                break
+            assigned[li] = mi
+            covered += weekly_cap[li]
+        if covered < peak[mi]:
+            return None
+    
+    # 2. 주차별로 각 모델의 수요를 배정된 라인에 라인 순서대로 용량만큼 채움
+    # 배정된 라인은 매주 같은 모델을 생산 (생산량 0인 주도 포함하여 체인지오버 없음)
+    line_sel = np.flatnonzero(assigned >= 0)
+    planned = np.zeros((n_weeks, line_sel.shape[0]), dtype=np.int64)
+    for w in range(n_weeks):
+        remaining = weekly[:, w].copy()
+        for k, li in enumerate(line_sel.tolist()):
+            mi = assigned[li]
+            planned[w, k] = min(weekly_cap[li], remaining[mi])
+            remaining[mi] -= planned[w, k]
+    
+    li_sel = np.tile(line_sel, n_weeks)
+    return li_sel, assigned[li_sel], np.repeat(np.arange(n_weeks), line_sel.shape[0]), planned.ravel()
+
+
+def _mix_plan_records(
+    li_sel: np.ndarray,
+    mi_sel: np.ndarray,
+    w_sel: np.ndarray,
+    planned: np.ndarray,
+    line_names: np.ndarray,
+    model_names: np.ndarray,
+    weekly_cap: np.ndarray
+) -> List[dict]:
+    """
+    (라인 코드, 모델 코드, 주차, 생산량) 배열로부터 API 응답용 생산 계획 리스트를 만듭니다.
+    
+    라인 가동률 = 계획 생산량 / 주간 최대 생산량 (최대 1.0)
+    """
+    utilization = np.minimum(planned / weekly_cap[li_sel], 1.0).round(2)
+    return [
+        {
+            'period': w + 1,  # 1주차부터 시작
+            'line_id': l,
+            'model': m,
+            'planned_units': q,
+            'line_utilization': u
+        }
+        for w, l, m, q, u in zip(
+            w_sel.tolist(), line_names[li_sel].tolist(), model_names[mi_sel].tolist(),
+            planned.tolist(), utilization.tolist()
+        )
+    ]
 
 
 class StubOptimizer:
@@ -30,14 +150,23 @@ class StubOptimizer:
         forecaster (SimpleForecaster): 생산량 예측을 수행하는 Forecaster 인스턴스
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        data_loader: Optional[DataLoader] = None,
+        forecaster: Optional[SimpleForecaster] = None
+    ):
         """
         StubOptimizer 초기화
         
-        DataLoader와 SimpleForecaster 인스턴스를 생성합니다.
+        DataLoader와 SimpleForecaster 인스턴스를 주입받습니다.
+        주입하지 않으면 모듈 공용 인스턴스를 사용하여 CSV/예측 캐시를 공유합니다.
+        
+        Args:
+            data_loader (DataLoader, optional): 사용할 DataLoader (기본값: 모듈 공용 인스턴스)
+            forecaster (SimpleForecaster, optional): 사용할 Forecaster (기본값: 모듈 공용 인스턴스)
         """
-        self.data_loader = DataLoader()
-        self.forecaster = SimpleForecaster()
+        self.data_loader = data_loader if data_loader is not None else _default_loader
+        self.forecaster = forecaster if forecaster is not None else _default_forecaster
 
     
     def simple_line_assignment(self, forecast_data: dict) -> dict:
@@ -84,62 +213,70 @@ class StubOptimizer:
             lines_df = data['lines']
             
             # 2. 라인별 지원 가능 모델 파싱
-            # eligible_models는 "ModelA,ModelB" 형식의 문자열이므로 쉼표로 분리
-            line_models = {}
-            for _, line in lines_df.iterrows():
-                line_id = line['line_id']
-                eligible = line['eligible_models'].split(',')
-                # 공백 제거하여 모델 리스트 생성
-                line_models[line_id] = [model.strip() for model in eligible]
+            # eligible_models는 "ModelA,ModelB" 형식의 문자열이므로 쉼표로 분리한 뒤
+            # explode로 (라인, 모델) 쌍마다 한 행인 long-form 테이블 생성
+            # (assign은 새 데이터프레임을 반환하므로 캐시된 lines_df는 수정되지 않음)
+            line_models = (
+                lines_df[['line_id', 'base_daily_capacity']]
+                .assign(model=lines_df['eligible_models'].str.split(','))
+                .explode('model')
+            )
+            line_models['model'] = line_models['model'].str.strip()  # 공백 제거
             
             # 3. 예측 데이터에서 주간 총 수요 계산
             # 첫 주 (7일) 수요만 사용
-            model_demands = {}
-            for model, forecast_list in forecast_data.items():
-                # 첫 7일의 예측값 합계
-                week1_demand = sum(item['forecast_units'] for item in forecast_list[:7])
-                model_demands[model] = week1_demand
-            
-            # 4. 각 모델을 지원 가능한 라인에 균등 분배
-            mix_plan = []
-            for model, total_demand in model_demands.items():
-                # 이 모델을 생산할 수 있는 라인 찾기
-                capable_lines = [
-                    line for line, models in line_models.items() 
-                    if model in models
-                ]
-                
-                if capable_lines:
-                    # 수요를 라인 개수로 나누어 균등 분배
-                    demand_per_line = total_demand // len(capable_lines)
-                    remainder = total_demand % len(capable_lines)
-                    
-                    for i, line_id in enumerate(capable_lines):
-                        # 기본 배정량
-                        planned_units = demand_per_line
-                        
-                        # 나머지를 첫 번째 라인들에 분배
-                        if i < remainder:
-                            planned_units += 1
-                        
-                        # 라인 가동률 계산
-                        # 가동률 = 계획 생산량 / (일일 용량 * 7일)
-                        line_capacity = lines_df[lines_df['line_id'] == line_id]['base_daily_capacity'].iloc[0]
-                        weekly_capacity = line_capacity * 7
-                        line_utilization = min(planned_units / weekly_capacity, 1.0)
-                        
-                        # 생산 계획 추가
-                        mix_plan.append({
-                            'period': 1,  # 1주차
-                            'line_id': line_id,
-                            'model': model,
-                            'planned_units': planned_units,
-                            'line_utilization': round(line_utilization, 2)
-                        })
+            models = list(forecast_data.keys())
+            week1_demand = _weekly_demand(forecast_data, 1)[:, 0]
+            
+            # 4. 각 모델을 지원 가능한 라인에 균등 분배 (벡터화)
+            # 모델명을 수요 모델 순서의 정수 코드로 바꿔 병합/그룹화를 문자열 비교 없이 수행
+            # (수요가 없는 모델은 코드 -1이 되어 병합에서 제외됨)
+            line_models['model_code'] = pd.Categorical(
+                line_models['model'], categories=models
+            ).codes.astype(np.int64)
+            
+            # 수요 테이블과 (라인, 모델) 테이블을 병합하여 모델별 생산 가능 라인 목록 생성
+            # inner merge는 왼쪽(수요) 키 순서를 유지하므로 모델 순서 → 라인 순서로 정렬됨
+            demand_df = pd.DataFrame({
+                'model_code': np.arange(len(models), dtype=np.int64),
+                'demand': week1_demand
+            })
+            plan_df = demand_df.merge(line_models, on='model_code', how='inner')
+            
+            # 모델별 생산 가능 라인 수와 라인 순번
+            by_model = plan_df.groupby('model_code', sort=False)
+            line_count = by_model['line_id'].transform('count').to_numpy()
+            line_rank = by_model.cumcount().to_numpy()
+            
+            # 수요를 라인 개수로 나누어 균등 분배하고, 나머지는 첫 번째 라인들에 1대씩 분배
+            demand = plan_df['demand'].to_numpy()
+            planned = demand // line_count + (line_rank < demand % line_count)
+            
+            # 라인 가동률 계산
+            # 가동률 = 계획 생산량 / (일일 용량 * 7일), 최대 1.0
+            weekly_capacity = plan_df['base_daily_capacity'].to_numpy() * 7
+            line_utilization = np.minimum(planned / weekly_capacity, 1.0).round(2)
+            
+            # 생산 계획 리스트 생성 (1주차)
+            mix_plan = [
+                {
+                    'period': 1,  # 1주차
+                    'line_id': line_id,
+                    'model': model,
+                    'planned_units': units,
+                    'line_utilization': utilization
+                }
+                for line_id, model, units, utilization in zip(
+                    plan_df['line_id'].tolist(),
+                    plan_df['model'].tolist(),
+                    planned.tolist(),
+                    line_utilization.tolist()
+                )
+            ]
             
             # 5. KPI 계산
-            total_planned = sum(item['planned_units'] for item in mix_plan)
-            total_demand = sum(model_demands.values())
+            total_planned = int(planned.sum())
+            total_demand = int(demand_df['demand'].sum())
             
             # 수요 충족률 계산 (%)
             fulfillment_rate = (total_planned / total_demand * 100) if total_demand > 0 else 100
@@ -225,8 +362,8 @@ class MilpOptimizer:
     """
     MILP(Mixed Integer Linear Programming) 기반 생산 믹스 최적화 클래스
     
-    OR-Tools의 SCIP 솔버를 사용하여 체인지오버 비용과 라인 용량을 고려한
-    실제 최적화를 수행합니다.
+    OR-Tools의 CP-SAT 솔버를 사용하여 체인지오버 비용과 라인 용량을 고려한
+    실제 최적화를 수행합니다. (MILP 정식화를 그대로 CP-SAT으로 풀이)
     
     최적화 목표:
     - 총 비용(생산 비용 + 체인지오버 비용) 최소화
@@ -242,14 +379,23 @@ class MilpOptimizer:
         forecaster (SimpleForecaster): 생산량 예측을 수행하는 Forecaster 인스턴스
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        data_loader: Optional[DataLoader] = None,
+        forecaster: Optional[SimpleForecaster] = None
+    ):
         """
         MilpOptimizer 초기화
         
-        DataLoader와 SimpleForecaster 인스턴스를 생성합니다.
+        DataLoader와 SimpleForecaster 인스턴스를 주입받습니다.
+        주입하지 않으면 모듈 공용 인스턴스를 사용하여 CSV/예측 캐시를 공유합니다.
+        
+        Args:
+            data_loader (DataLoader, optional): 사용할 DataLoader (기본값: 모듈 공용 인스턴스)
+            forecaster (SimpleForecaster, optional): 사용할 Forecaster (기본값: 모듈 공용 인스턴스)
         """
-        self.data_loader = DataLoader()
-        self.forecaster = SimpleForecaster()
+        self.data_loader = data_loader if data_loader is not None else _default_loader
+        self.forecaster = forecaster if forecaster is not None else _default_forecaster
     
     def run_optimization(self) -> dict:
         """
@@ -262,6 +408,9 @@ class MilpOptimizer:
         5. 솔버 실행
         6. 결과 파싱 및 KPI 계산
         
+        라인마다 모델 하나를 고정 배정하는 것만으로 모든 수요를 충족할 수 있으면
+        그 계획이 최적해이므로 솔버를 실행하지 않고 바로 반환합니다.
+        
         Returns:
             dict: 최적화 결과
                 성공 시:
@@ -272,6 +421,13 @@ class MilpOptimizer:
                     - status (str): "error"
                     - message (str): 에러 메시지
         """
+        if not _HAS_ORTOOLS:
+            return {
+                "status": "error",
+                "message": "OR-Tools가 설치되어 있지 않아 MILP 최적화를 실행할 수 없습니다.",
+                "suggestion": "pip install ortools 후 다시 시도하거나 Stub 모드를 사용하세요."
+            }
+        
         try:
             # 1. 데이터 로드
             data = self.data_loader.load_all_data()
@@ -283,146 +439,223 @@ class MilpOptimizer:
             if forecast_result['status'] != 'success':
                 return forecast_result
             
-            # 2. 주간 수요 집계 (첫 4주)
-            demands = {}
-            for model, forecast in forecast_result['forecasts'].items():
-                demands[model] = {}
-                for week in range(4):
-                    start_day = week * 7
-                    end_day = start_day + 7
-                    # 해당 주의 예측값 합계
-                    weekly_demand = sum(
-                        d['forecast_units'] 
-                        for d in forecast[start_day:end_day] 
-                        if start_day <= forecast.index(d) < end_day
-                    )
-                    demands[model][week] = weekly_demand
+            # 2. 주간 수요 집계 (첫 4주) -> weekly[mi, w]
+            models = list(forecast_result['forecasts'].keys())
+            weekly = _weekly_demand(forecast_result['forecasts'], 4)
             
-            # 3. MILP 모델 생성
-            from ortools.linear_solver import pywraplp
+            # 3. 라인/모델 데이터 준비
+            # 라인, 모델, 주차 리스트
+            # 라인/모델은 문자열 대신 정수 코드(li: lines_df 행 위치, mi: models 위치)로 다루고
+            # 결과를 만들 때만 이름으로 되돌림
+            lines = lines_df['line_id'].tolist()
+            line_names = np.array(lines, dtype=object)
+            model_names = np.array(models, dtype=object)
+            model_index = {m: mi for mi, m in enumerate(models)}
+            n_lines, n_models = len(lines), len(models)
+            weeks = range(4)  # 4주
             
-            # SCIP 솔버 생성
-            solver = pywraplp.Solver.CreateSolver('SCIP')
-            if not solver:
+            # 라인별 주간 최대 생산량 = 일일 용량 * 7일 (라인 코드로 인덱싱하는 배열)
+            # OR-Tools는 NumPy 정수를 받지 않으므로 변수 생성에는 파이썬 int 리스트 사용
+            weekly_cap_arr = lines_df['base_daily_capacity'].to_numpy(dtype=np.int64) * 7
+            weekly_cap = weekly_cap_arr.tolist()
+            
+            # 지원 가능 여부 행렬: eligible[li, mi]
+            # (루프 안에서 데이터프레임을 필터링하지 않도록 미리 생성)
+            eligible = np.zeros((n_lines, n_models), dtype=bool)
+            for li, e in enumerate(lines_df['eligible_models']):
+                for m in e.split(','):
+                    mi = model_index.get(m.strip())
+                    if mi is not None:
+                        eligible[li, mi] = True
+            
+            # 라인별 생산 가능 모델 코드 (models 순서 유지)
+            # 지원하지 않는 (라인, 모델) 조합은 변수를 만들지 않아
+            # Y=0 고정 제약 없이도 생산 불가가 보장되고 솔버 모델 크기가 줄어듦
+            models_for_line = [np.flatnonzero(eligible[li]).tolist() for li in range(n_lines)]
+            # 역방향 맵: 모델별 생산 가능 라인 코드 (수요 충족 제약에서 전체 라인을 훑지 않도록)
+            lines_for_model = [np.flatnonzero(eligible[:, mi]).tolist() for mi in range(n_models)]
+            
+            weekly_demand = weekly.tolist()
+            total_demand = int(weekly.sum())
+            
+            # 빠른 경로: 라인당 모델 하나씩 고정 배정으로 수요를 모두 충족할 수 있으면
+            # 체인지오버 없이 생산량 = 수요인 계획이 목적 함수 하한을 달성하는 최적해이므로 솔버 생략
+            greedy = _single_model_plan(weekly, weekly_cap_arr, lines_for_model)
+            if greedy is not None:
+                li_sel, mi_sel, w_sel, planned = greedy
                 return {
-                    "status": "error",
-                    "message": "SCIP 솔버를 사용할 수 없습니다. OR-Tools가 올바르게 설치되었는지 확인하세요."
+                    "status": "success",
+                    "mix_plan": _mix_plan_records(
+                        li_sel, mi_sel, w_sel, planned, line_names, model_names, weekly_cap_arr
+                    ),
+                    "kpi": {
+                        "total_cost": 1000 * total_demand,
+                        "changeovers": 0,
+                        "changeover_hours": 0,
+                        "fulfillment_rate": 100.0,
+                        "estimated_ot": 0
+                    }
                 }
             
-            # 4. 변수 정의
-            # 라인, 모델, 주차 리스트
-            lines = lines_df['line_id'].tolist()
-            models = list(demands.keys())
-            weeks = range(4)  # 4주
+            # 4. CP-SAT 모델 생성 및 변수 정의
+            # 정수/불리언 변수만 있는 할당 문제이므로 SCIP 대신 CP-SAT 사용
+            # (제약 전파와 병렬 포트폴리오 탐색으로 더 빠르게 풀림)
+            model = cp_model.CpModel()
             
-            # Q[l, m, w]: 라인 l에서 모델 m을 주차 w에 생산하는 수량 (정수 변수)
+            # Q[li, mi, w]: 라인 li에서 모델 mi를 주차 w에 생산하는 수량 (정수 변수)
             Q = {}
-            # Y[l, m, w]: 라인 l에서 모델 m을 주차 w에 생산하면 1, 아니면 0 (불리언 변수)
+            # Y[li, mi, w]: 라인 li에서 모델 mi를 주차 w에 생산하면 1, 아니면 0 (불리언 변수)
             Y = {}
             
-            for l in lines:
-                for m in models:
+            for li in range(n_lines):
+                for mi in models_for_line[li]:
                     for w in weeks:
-                        # 최대 생산량 = 일일 용량 * 7일
-                        max_prod = lines_df[lines_df['line_id'] == l]['base_daily_capacity'].iloc[0] * 7
-                        
-                        # 생산량 변수 (0 ~ max_prod)
-                        Q[l, m, w] = solver.IntVar(0, max_prod, f'Q_{l}_{m}_{w}')
+                        # 생산량 변수 (0 ~ min(주간 용량, 해당 주 수요))
+                        # 생산 비용을 최소화하므로 수요를 넘겨 생산하는 해는 최적이 아님
+                        # -> 상한을 수요로 좁혀도 최적해는 같고 탐색 공간만 줄어듦
+                        max_prod = min(weekly_cap[li], weekly_demand[mi][w])
+                        name = f'{lines[li]}_{models[mi]}_{w}'
+                        Q[li, mi, w] = model.NewIntVar(0, max_prod, f'Q_{name}')
                         
                         # 생산 여부 변수 (0 또는 1)
-                        Y[l, m, w] = solver.BoolVar(f'Y_{l}_{m}_{w}')
+                        Y[li, mi, w] = model.NewBoolVar(f'Y_{name}')
             
             # 5. 제약 조건 추가
             
             # 제약 1: 라인당 주간 단일 모델 생산
             # 각 라인은 한 주에 최대 하나의 모델만 생산할 수 있음
-            for l in lines:
+            for li in range(n_lines):
+                if not models_for_line[li]:
+                    continue
                 for w in weeks:
-                    solver.Add(sum(Y[l, m, w] for m in models) <= 1)
+                    model.AddAtMostOne(Y[li, mi, w] for mi in models_for_line[li])
             
             # 제약 2: 생산량-생산여부 연결
             # 모델을 생산하지 않으면 (Y=0) 생산량도 0이어야 함
-            # 모델을 생산하면 (Y=1) 생산량은 최대 용량까지 가능
-            for l in lines:
-                for m in models:
-                    for w in weeks:
-                        max_prod = lines_df[lines_df['line_id'] == l]['base_daily_capacity'].iloc[0] * 7
-                        solver.Add(Q[l, m, w] <= Y[l, m, w] * max_prod)
+            # 모델을 생산하면 (Y=1) 생산량은 min(주간 용량, 수요)까지 가능 (변수 범위로 제한됨)
+            # big-M 대신 CP-SAT의 조건부 제약(OnlyEnforceIf) 사용
+            for key, q in Q.items():
+                model.Add(q == 0).OnlyEnforceIf(Y[key].Not())
             
             # 제약 3: 수요 충족
-            # 각 모델의 주간 수요는 모든 라인의 생산량 합으로 충족되어야 함
-            for m in models:
+            # 각 모델의 주간 수요는 생산 가능한 라인들의 생산량 합으로 충족되어야 함
+            # (생산 가능한 라인의 변수만 합산)
+            for mi in range(n_models):
                 for w in weeks:
-                    if m in demands and w in demands[m]:
-                        solver.Add(sum(Q[l, m, w] for l in lines) >= demands[m][w])
-            
-            # 제약 4: 라인 적격성
-            # 각 라인은 지원 가능한 모델만 생산할 수 있음
-            for l in lines:
-                # 라인의 지원 가능 모델 리스트
-                eligible = lines_df[lines_df['line_id'] == l]['eligible_models'].iloc[0].split(',')
-                eligible_models = [m.strip() for m in eligible]
-                
-                for m in models:
-                    if m not in eligible_models:
-                        # 지원하지 않는 모델은 생산 불가
-                        for w in weeks:
-                            solver.Add(Y[l, m, w] == 0)
+                    model.Add(
+                        sum(Q[li, mi, w] for li in lines_for_model[mi]) >= weekly_demand[mi][w]
+                    )
+            
+            # 제약 4: 체인지오버 (compact 정식화)
+            # Z[li, mi, w]: 라인 li가 주차 w 시작 시 모델 mi로 전환하면 1
+            # (출발 모델, 도착 모델) 쌍마다 변수를 두는 대신 도착 모델 기준 변수 하나와
+            # 전환당 부등식 하나(Z >= Y[w] - Y[w-1])만 사용하여 제약 수를 줄임
+            # 전환 비용/시간은 해당 라인에서 도착 모델로 전환하는 경우 중 최솟값 사용하고
+            # (라인 코드, 모델 코드)로 인덱싱하는 행렬로 변환 (없는 전환은 0)
+            inbound = (
+                costs_df.groupby(['line_id', 'to_model'])[['changeover_cost', 'changeover_hours']]
+                .min()
+                .reindex(pd.MultiIndex.from_product([lines, models]))
+                .fillna(0)
+            )
+            changeover_cost = (
+                inbound['changeover_cost'].to_numpy(dtype=np.int64).reshape(n_lines, n_models).tolist()
+            )
+            changeover_hours = (
+                inbound['changeover_hours'].to_numpy(dtype=np.int64).reshape(n_lines, n_models)
+            )
+            
+            Z = {}
+            for li in range(n_lines):
+                for w in weeks:
+                    if w == 0:
+                        continue  # 첫 주는 이전 주가 없으므로 전환 없음
+                    for mi in models_for_line[li]:
+                        Z[li, mi, w] = model.NewBoolVar(f'Z_{lines[li]}_{models[mi]}_{w}')
+                        model.Add(Z[li, mi, w] >= Y[li, mi, w] - Y[li, mi, w - 1])
+                    # 한 라인은 한 주에 최대 한 번만 전환
+                    if models_for_line[li]:
+                        model.AddAtMostOne(Z[li, mi, w] for mi in models_for_line[li])
             
             # 6. 목적 함수: 총 비용 최소화
-            objective = solver.Objective()
-            objective.SetMinimization()
+            # 생산 비용 (단순화: 모델별 생산 단가 1000원/대) + 체인지오버 비용
+            model.Minimize(
+                1000 * sum(Q.values())
+                + sum(changeover_cost[li][mi] * z for (li, mi, w), z in Z.items())
+            )
             
-            # 생산 비용 (단순화: 모델별 생산 단가 1000원/대)
-            for l in lines:
-                for m in models:
+            # 7. 초기 해 힌트 (warm start)
+            # StubOptimizer의 균등 분배 결과를 첫 해 후보로 제공하여 초기 실행 가능해 탐색 시간 단축
+            # Stub은 한 라인에 여러 모델을 배정할 수 있으므로 라인별로 배정량이 가장 큰 모델 하나만 사용
+            # (힌트는 탐색 방향만 제시하며, 실행 불가능하더라도 솔버가 무시하고 계속 탐색함)
+            stub_result = StubOptimizer(self.data_loader, self.forecaster).simple_line_assignment(
+                forecast_result['forecasts']
+            )
+            if stub_result['status'] == 'success':
+                line_index = {l: li for li, l in enumerate(lines)}
+                hinted_lines = set()
+                for plan in sorted(stub_result['mix_plan'], key=lambda p: -p['planned_units']):
+                    li = line_index.get(plan['line_id'])
+                    mi = model_index.get(plan['model'])
+                    if li in hinted_lines or (li, mi, 0) not in Y:
+                        continue
+                    hinted_lines.add(li)
+                    # 같은 모델을 4주 내내 생산 (체인지오버 없음), 1주차 생산량은 Stub 배정량
                     for w in weeks:
-                        objective.SetCoefficient(Q[l, m, w], 1000)
-            
-            # 체인지오버 비용은 Phase 1에서는 생략 (단순화)
-            # Phase 2에서 추가 구현 가능
+                        model.AddHint(Y[li, mi, w], 1)
+                    model.AddHint(
+                        Q[li, mi, 0],
+                        min(plan['planned_units'], weekly_cap[li], weekly_demand[mi][0])
+                    )
             
-            # 7. 솔버 실행
-            status = solver.Solve()
+            # 8. 솔버 실행
+            solver = cp_model.CpSolver()
+            solver.parameters.max_time_in_seconds = 10.0  # 10초 타임아웃
+            # 병렬 포트폴리오 탐색 (CPU 코어 수보다 많으면 작업자끼리 시간을 나눠 써서 오히려 느려짐)
+            solver.parameters.num_search_workers = min(8, os.cpu_count() or 1)
+            status = solver.Solve(model)
             
-            # 8. 결과 파싱
-            if status == pywraplp.Solver.OPTIMAL:
-                # 최적해를 찾은 경우
-                mix_plan = []
-                total_planned = 0
+            # 9. 결과 파싱
+            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
+                # 최적해(또는 제한 시간 내 실행 가능해)를 찾은 경우
+                # 변수별 C++ 호출 대신 Y/Q 해 값을 한 번에 배열로 가져옴
+                # (Q와 Y는 같은 (라인, 모델, 주차) 키 순서로 생성됨)
+                keys = np.array(list(Y.keys()), dtype=np.int64).reshape(-1, 3)
+                y_on = solver.BooleanValues(pd.Series(list(Y.values()), dtype=object)).to_numpy(dtype=bool)
+                q_val = solver.Values(pd.Series(list(Q.values()), dtype=object)).to_numpy(dtype=np.int64)
                 
-                for w in weeks:
-                    for l in lines:
-                        for m in models:
-                            # Y 값이 1이면 (해당 모델을 생산하면)
-                            if Y[l, m, w].solution_value() > 0.5:
-                                planned_units = int(Q[l, m, w].solution_value())
-                                total_planned += planned_units
-                                
-                                # 라인 가동률 계산
-                                line_capacity = lines_df[lines_df['line_id'] == l]['base_daily_capacity'].iloc[0]
-                                weekly_capacity = line_capacity * 7
-                                line_utilization = min(planned_units / weekly_capacity, 1.0)
-                                
-                                mix_plan.append({
-                                    'period': w + 1,  # 1주차부터 시작
-                                    'line_id': l,
-                                    'model': m,
-                                    'planned_units': planned_units,
-                                    'line_utilization': round(line_utilization, 2)
-                                })
+                # 생산하는 조합(Y=1)만 남기고 주차 → 라인 → 모델 순으로 정렬
+                # (키 생성 순서가 라인 → 모델 → 주차이므로 주차 기준 안정 정렬)
+                order = np.flatnonzero(y_on)
+                order = order[np.argsort(keys[order, 2], kind='stable')]
+                li_sel, mi_sel, w_sel = keys[order, 0], keys[order, 1], keys[order, 2]
+                planned = q_val[order]
+                
+                mix_plan = _mix_plan_records(
+                    li_sel, mi_sel, w_sel, planned, line_names, model_names, weekly_cap_arr
+                )
+                total_planned = int(planned.sum())
+                
+                # 체인지오버 횟수 및 시간
+                # 비용이 0인 전환은 Z 값이 임의로 정해질 수 있으므로 Y 값으로 직접 판정
+                y_value = dict(zip(Y.keys(), y_on.tolist()))
+                switched = [
+                    (li, mi) for (li, mi, w) in Z
+                    if y_value[li, mi, w] and not y_value[li, mi, w - 1]
+                ]
+                total_changeovers = len(switched)
+                total_changeover_hours = int(sum(changeover_hours[li, mi] for li, mi in switched))
                 
                 # KPI 계산
-                total_demand = sum(d for m_d in demands.values() for d in m_d.values())
                 fulfillment_rate = (total_planned / total_demand * 100) if total_demand > 0 else 100
                 
                 return {
                     "status": "success",
                     "mix_plan": mix_plan,
                     "kpi": {
-                        "total_cost": int(solver.Objective().Value()),
-                        "changeovers": 0,  # Phase 1에서는 계산 생략
-                        "changeover_hours": 0,
+                        "total_cost": int(solver.ObjectiveValue()),
+                        "changeovers": total_changeovers,
+                        "changeover_hours": total_changeover_hours,
                         "fulfillment_rate": round(fulfillment_rate, 1),
                         "estimated_ot": 0
                     }
@@ -11,9 +11,150 @@ Phase 2에서는 OR-Tools CP-SAT를 사용하여 제약 조건을 고려한 최
 - 스케줄 결과 및 KPI 반환
 """
 
-import pandas as pd
-from data_loader import DataLoader
-from typing import List, Dict
+import os
+import numpy as np
+from collections import defaultdict
+from data_loader import DataLoader, _default_loader
+from _schedule_kernel import _expand_slots, _expand_required_slots
+from typing import List, Dict, Optional
+
+# OR-Tools는 CP-SAT 스케줄링에서 Greedy 빠른 경로로 최적해를 얻지 못했을 때만 필요하므로 선택적으로 임포트
+try:
+    from ortools.sat.python import cp_model
+    _HAS_ORTOOLS = True
+except ImportError:
+    cp_model = None
+    _HAS_ORTOOLS = False
+
+
+# 하루 교대 종류 (출력 순서: 주간 → 야간)
+SHIFTS = ['Day', 'Night']
+
+
+def _to_soa(mix_plan: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    생산 계획 리스트(행 dict)를 컬럼별 NumPy 배열(SoA)로 한 번만 변환합니다.
+    
+    스케줄러 내부에서는 행 dict의 문자열 키를 반복 조회하지 않고 이 배열을 정수 인덱스로 참조합니다.
+    
+    Args:
+        mix_plan (List[Dict]): 생산 계획 리스트 (period, line_id, planned_units 포함)
+    
+    Returns:
+        Dict[str, np.ndarray]: 컬럼별 배열
+            - period (np.ndarray): 주차, object (정수 또는 "W1" 같은 라벨 그대로)
+            - line_id (np.ndarray): 라인 ID, object
+            - planned_units (np.ndarray): 계획 생산량, float64
+    
+    Raises:
+        ValueError: 주차가 결측치이거나 정수가 아닌 숫자일 때, 계획 생산량에 결측치가 있을 때
+    """
+    periods = []
+    for p in mix_plan:
+        period = p['period']
+        if period is None or (isinstance(period, (float, np.floating)) and np.isnan(period)):
+            raise ValueError("주차(period)에 결측치가 있습니다.")
+        # 실수 주차는 정수 값(예: 1.0)만 허용하여 정수로 변환 (1.5 등은 에러)
+        if isinstance(period, (float, np.floating)):
+            if not float(period).is_integer():
+                raise ValueError(f"주차(period)가 정수가 아닙니다: {period}")
+            period = int(period)
+        periods.append(period)
+    
+    planned_units = np.fromiter((p['planned_units'] for p in mix_plan), dtype=np.float64, count=len(mix_plan))
+    if np.isnan(planned_units).any():
+        raise ValueError("계획 생산량(planned_units)에 결측치가 있습니다.")
+    
+    return {
+        'period': np.array(periods, dtype=object),
+        'line_id': np.array([p['line_id'] for p in mix_plan], dtype=object),
+        'planned_units': planned_units
+    }
+
+
+def _required_slots(mix_plan: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    생산 계획으로부터 (주차, 일자, 라인, 교대)별 필요 인원 슬롯 테이블을 생성합니다.
+    
+    계획마다 일간 생산량 100대당 1명을 배치하고 두 교대에 절반씩 나누며,
+    홀수일 때 남는 1명은 주간 교대에 배정합니다.
+    필요 인원이 0명인 계획은 슬롯을 만들지 않으며,
+    행 순서는 계획 → 일자(0~6) → 교대(Day, Night) 순입니다.
+    
+    Args:
+        mix_plan (List[Dict]): 생산 계획 리스트 (period, line_id, planned_units 포함)
+    
+    Returns:
+        Dict[str, np.ndarray]: 컬럼별 슬롯 배열 (week, day, line_id, shift, required)
+    """
+    mp = _to_soa(mix_plan)
+    
+    # 필요 인원 계산과 7일 × 2교대 전개는 JIT 커널에서 수행하고 정수 인덱스만 받음
+    # 호출자는 컬럼 단위로만 읽으므로 DataFrame을 만들지 않고 배열 dict로 반환
+    plan_row, day, shift_idx, required = _expand_required_slots(mp['planned_units'])
+    return {
+        'week': mp['period'][plan_row],
+        'day': day,
+        'line_id': mp['line_id'][plan_row],
+        'shift': np.array(SHIFTS, dtype=object)[shift_idx],
+        'required': required
+    }
+
+
+def _greedy_min_wage(slot_day: List[int], slot_required: List[int], wages: np.ndarray, max_days: int = 5):
+    """
+    시급이 낮은 작업자부터 배정하는 Greedy 스케줄을 만들고, 최적임이 보장될 때만 반환합니다.
+    
+    각 작업자는 남은 인원이 가장 많은 날짜부터 하루 1교대, 최대 max_days일까지 배정합니다.
+    모든 작업자는 최대 min(max_days, 근무일 수)개 슬롯만 맡을 수 있으므로
+    "싼 작업자 순으로 그 개수만큼 채운 비용"이 어떤 실행 가능해보다도 작거나 같은 하한이 됩니다.
+    Greedy 결과가 모든 자리를 채우고 비용이 이 하한과 같으면 최적해입니다.
+    
+    Args:
+        slot_day (List[int]): 슬롯별 일자 인덱스
+        slot_required (List[int]): 슬롯별 필요 인원
+        wages (np.ndarray): 작업자별 시급, shape (W,)
+        max_days (int): 작업자별 주간 최대 근무일 수 (기본값: 5)
+    
+    Returns:
+        np.ndarray or None: (슬롯, 작업자) 배정 불리언 행렬, 최적이 보장되지 않으면 None
+    """
+    n_slots, n_workers = len(slot_day), len(wages)
+    seats_left = np.asarray(slot_required, dtype=np.int64).copy()
+    slot_day_arr = np.asarray(slot_day, dtype=np.int64)
+    day_left = np.bincount(slot_day_arr, weights=seats_left, minlength=7).astype(np.int64)
+    total_seats = int(seats_left.sum())
+    
+    # 1. 비용 하한: 싼 작업자부터 min(max_days, 근무일 수)개씩 자리를 채운다고 가정
+    order = np.argsort(wages, kind='stable')
+    per_worker = min(max_days, int((day_left > 0).sum()))
+    units = np.minimum(per_worker, np.maximum(total_seats - per_worker * np.arange(n_workers), 0))
+    lower_bound = int((wages[order] * units).sum())
+    
+    # 2. Greedy 배정: 싼 작업자부터 남은 인원이 많은 날짜 순으로 하루 1교대씩
+    # 날짜별 슬롯 인덱스를 한 번만 구성하여 배정마다 전체 슬롯을 다시 비교하지 않도록 함
+    slots_of_day = [np.flatnonzero(slot_day_arr == d) for d in range(len(day_left))]
+    assigned = np.zeros((n_slots, n_workers), dtype=bool)
+    cost = 0
+    for w in order.tolist():
+        if total_seats == 0:
+            break
+        open_days = np.flatnonzero(day_left > 0)
+        open_days = open_days[np.argsort(-day_left[open_days], kind='stable')][:max_days]
+        for d in open_days.tolist():
+            # 해당 날짜에서 남은 인원이 가장 많은 슬롯에 배정
+            # (남은 인원이 있는 날짜이므로 최댓값은 항상 1 이상)
+            day_slots = slots_of_day[d]
+            i = day_slots[np.argmax(seats_left[day_slots])]
+            assigned[i, w] = True
+            seats_left[i] -= 1
+            day_left[d] -= 1
+            total_seats -= 1
+            cost += int(wages[w])
+    
+    if total_seats > 0 or cost != lower_bound:
+        return None
+    return assigned
 
 
 class StubScheduler:
@@ -27,14 +168,35 @@ class StubScheduler:
         data_loader (DataLoader): CSV 데이터를 로드하는 DataLoader 인스턴스
     """
     
-    def __init__(self):
+    def __init__(self, data_loader: Optional[DataLoader] = None):
         """
         StubScheduler 초기화
         
-        DataLoader 인스턴스를 생성합니다.
+        DataLoader 인스턴스를 주입받습니다.
+        주입하지 않으면 모듈 공용 인스턴스를 사용하여 CSV 캐시를 공유합니다.
+        
+        Args:
+            data_loader (DataLoader, optional): 사용할 DataLoader (기본값: 모듈 공용 인스턴스)
         """
-        self.data_loader = DataLoader()
-
+        self.data_loader = data_loader if data_loader is not None else _default_loader
+        # 연차순 작업자 컬럼 배열 캐시: (원본 데이터프레임, (작업자 ID 배열, 이름 배열))
+        self._worker_cache = None
+    
+    def _worker_arrays(self):
+        """
+        연차 높은 순으로 정렬된 작업자 ID/이름 배열을 반환합니다.
+        
+        DataLoader가 작업자 CSV 변경 없이 같은 정렬 결과를 반환하면 이전에 꺼낸 배열을 재사용하여
+        호출마다 데이터프레임 컬럼을 다시 변환하지 않습니다.
+        
+        Returns:
+            tuple: (작업자 ID 배열, 작업자 이름 배열), 각 shape (W,), object
+        """
+        sorted_workers = self.data_loader.load_workers_by_seniority()
+        if self._worker_cache is None or self._worker_cache[0] is not sorted_workers:
+            arrays = (sorted_workers['worker_id'].to_numpy(), sorted_workers['name'].to_numpy())
+            self._worker_cache = (sorted_workers, arrays)
+        return self._worker_cache[1]
     
     def run_stub_schedule(self, mix_plan: List[Dict]) -> dict:
         """
@@ -70,54 +232,65 @@ class StubScheduler:
                     - message (str): 에러 메시지
         """
         try:
-            # 1. 작업자 데이터 로드 (연차 높은 순으로 정렬)
-            data = self.data_loader.load_all_data()
-            workers_df = data['workers'].sort_values('years', ascending=False)
+            # 1. 작업자 데이터 로드 (연차 높은 순으로 정렬, 컬럼 배열까지 캐시됨)
+            # 레코드 dict를 만들지 않고 컬럼을 ndarray로 꺼내 Round-robin 배정에 인덱싱
+            worker_ids, worker_names = self._worker_arrays()
+            n_workers = len(worker_ids)
             
             # 2. 필요 인원 산정
-            schedule = []
-            required_slots = []
+            # 주간 계획을 일간으로 분배하고 100대당 1명, 두 교대에 절반씩 배정
+            # (홀수 인원의 나머지는 주간 교대, np.round는 파이썬 round와 같은 은행가 반올림)
+            mp = _to_soa(mix_plan)
+            daily_units = mp['planned_units'] / 7
+            # 음수 생산량은 0명으로 처리 (NaN은 _to_soa에서 에러)
+            required_staff = np.maximum(np.round(daily_units / 100).astype(np.int64), 0)
+            required_per_shift = np.stack([required_staff - required_staff // 2, required_staff // 2], axis=1)
+            
+            # 3. 슬롯 전개 및 작업자 배정 (JIT 커널, 계획 → 7일 → 주간/야간 → 필요 인원 순)
+            # Round-robin 시작 위치는 커널이 계획별 누적합으로 계산
+            # 주차별 프로세스 풀 병렬화는 사용하지 않음: 커널은 전체 실행 시간의 1% 미만이고
+            # 결과 schedule을 pickle로 주고받는 비용만으로 직렬 실행 전체와 비슷하거나 더 큼
+            # (9주 × 30라인: 전체 8.7ms, 커널 0.016ms, 결과 pickle 왕복 2.8ms /
+            #  52주 × 100라인: 전체 75ms, 커널 0.6ms, 결과 pickle 왕복 90ms)
+            if int(required_per_shift.sum()) > 0 and n_workers == 0:
+                raise ValueError("배정할 작업자 데이터가 없습니다.")
             
-            for plan in mix_plan:
-                # 주간 계획을 일간으로 분배
-                daily_units = plan['planned_units'] / 7
-                
-                # 필요 인원 계산 (100대당 1명)
-                required_staff = round(daily_units / 100)
-                
-                # 주간 계획을 7일로 분배
-                for day in range(7):
-                    # 주간/야간 2교대 가정
-                    for shift in ['Day', 'Night']:
-                        if required_staff > 0:
-                            required_slots.append({
-                                'week': plan['period'],
-                                'day': day,
-                                'line_id': plan['line_id'],
-                                'shift': shift,
-                                'required': required_staff // 2  # 교대당 인원
-                            })
+            plan_row, day, shift_idx, worker_row = _expand_slots(required_per_shift, max(n_workers, 1))
             
-            # 3. 연차 높은 순으로 작업자 배정 (Round-robin)
-            worker_list = workers_df.to_dict('records')
-            worker_idx = 0
+            # 4. 컬럼별 배열(SoA)로 결과 생성
+            # 커널이 돌려준 정수 인덱스로 원본 문자열 컬럼을 다시 꺼냄
+            # 날짜 라벨은 행마다 포맷하지 않고 (주차, 일자)별로 한 번만 만든 뒤 인덱싱
+            # (같은 주차의 여러 라인/모델 계획이 라벨을 공유)
+            # 주차는 정수와 문자열 라벨이 섞일 수 있으므로 정렬(np.unique) 대신 dict로 등장 순서대로 번호를 매김
+            period_index = {}
+            period_row = np.fromiter(
+                (period_index.setdefault(w, len(period_index)) for w in mp['period'].tolist()),
+                dtype=np.int64, count=len(mp['period'])
+            )
+            date_labels = np.array(
+                [f"Week {w}, Day {d+1}" for w in period_index for d in range(7)],
+                dtype=object
+            ).reshape(len(period_index), 7)
+            dates = date_labels[period_row[plan_row], day]
+            line_ids = mp['line_id'][plan_row]
+            shifts = np.array(SHIFTS, dtype=object)[shift_idx]
             
-            for slot in required_slots:
-                for _ in range(slot['required']):
-                    # 작업자 순환 배정
-                    worker = worker_list[worker_idx % len(worker_list)]
-                    
-                    schedule.append({
-                        'date': f"Week {slot['week']}, Day {slot['day']+1}",
-                        'line_id': slot['line_id'],
-                        'shift': slot['shift'],
-                        'worker_id': worker['worker_id'],
-                        'worker_name': worker['name']
-                    })
-                    
-                    worker_idx += 1
+            # API 응답 형식(레코드 리스트)은 유지하고 마지막에 한 번만 행 dict로 변환
+            schedule = [
+                {
+                    'date': date,
+                    'line_id': l,
+                    'shift': s,
+                    'worker_id': wid,
+                    'worker_name': wname
+                }
+                for date, l, s, wid, wname in zip(
+                    dates.tolist(), line_ids.tolist(), shifts.tolist(),
+                    worker_ids[worker_row].tolist(), worker_names[worker_row].tolist()
+                )
+            ]
             
-            # 4. 결과 반환
+            # 5. 결과 반환
             return {
                 "status": "success",
                 "schedule": schedule
@@ -186,13 +359,62 @@ class CpsatScheduler:
         data_loader (DataLoader): CSV 데이터를 로드하는 DataLoader 인스턴스
     """
     
-    def __init__(self):
+    def __init__(self, data_loader: Optional[DataLoader] = None):
         """
         CpsatScheduler 초기화
         
-        DataLoader 인스턴스를 생성합니다.
+        DataLoader 인스턴스를 주입받습니다.
+        주입하지 않으면 모듈 공용 인스턴스를 사용하여 CSV 캐시를 공유합니다.
+        
+        Args:
+            data_loader (DataLoader, optional): 사용할 DataLoader (기본값: 모듈 공용 인스턴스)
         """
-        self.data_loader = DataLoader()
+        self.data_loader = data_loader if data_loader is not None else _default_loader
+        # 작업자 데이터프레임으로부터 만든 파생 데이터 캐시: (원본 데이터프레임, 파생 데이터 dict)
+        self._worker_cache = None
+    
+    def _worker_data(self) -> dict:
+        """
+        호출마다 바뀌지 않는 작업자 파생 데이터(ID/시급/이름, 시급 그룹)를 반환합니다.
+        
+        DataLoader가 작업자 CSV 변경 없이 같은 데이터프레임을 반환하면 이전에 만든 결과를
+        재사용하고, CSV가 변경되어 새 데이터프레임이 오면 다시 만듭니다.
+        
+        Returns:
+            dict: workers, wage, name, wages, names, group_wages, group_members, hint_order
+        """
+        workers_df = self.data_loader.load_workers()
+        if self._worker_cache is not None and self._worker_cache[0] is workers_df:
+            return self._worker_cache[1]
+        
+        # 1. 작업자별 시급/이름 (루프 안에서 데이터프레임을 필터링하지 않도록 미리 생성)
+        # OR-Tools는 NumPy 정수를 받지 않으므로 파이썬 int로 변환
+        workers = workers_df['worker_id'].tolist()
+        wage = {w: int(v) for w, v in zip(workers, workers_df['wage_per_hour'])}
+        name = dict(zip(workers, workers_df['name']))
+        
+        # 2. 시급 그룹: 그룹 안의 작업자는 연차 높은 순으로 정렬 (해 복원 시 배정 우선순위)
+        seniority = self.data_loader.load_workers_by_seniority()['worker_id'].tolist()
+        worker_pos = {w: k for k, w in enumerate(workers)}
+        groups = defaultdict(list)
+        for w in seniority:
+            groups[wage[w]].append(worker_pos[w])
+        group_wages = sorted(groups)
+        group_index = {g: k for k, g in enumerate(group_wages)}
+        
+        data = {
+            'workers': workers,
+            'wage': wage,
+            'name': name,
+            'wages': np.array([wage[w] for w in workers], dtype=np.int64),
+            'names': np.array([name[w] for w in workers], dtype=object),
+            'group_wages': group_wages,
+            'group_members': [np.array(groups[g], dtype=np.int64) for g in group_wages],
+            # 초기 해 힌트용: 연차 높은 순 작업자의 시급 그룹 인덱스
+            'hint_order': np.array([group_index[wage[w]] for w in seniority], dtype=np.int64),
+        }
+        self._worker_cache = (workers_df, data)
+        return data
     
     def run_cpsat_schedule(self, mix_plan: List[Dict]) -> dict:
         """
@@ -208,147 +430,225 @@ class CpsatScheduler:
             dict: 스케줄링 결과 (schedule, kpi 포함)
         """
         try:
-            from ortools.sat.python import cp_model
-            
-            # 1. 데이터 로드
-            data = self.data_loader.load_all_data()
-            workers_df = data['workers']
+            # 1. 데이터 로드 (작업자 CSV만 필요, 파생 데이터까지 캐시됨)
+            worker_data = self._worker_data()
+            workers = worker_data['workers']
+            wages = worker_data['wages']
             
-            # 2. 필요 인원 산정 (StubScheduler와 동일)
-            required_slots = []
-            for plan in mix_plan:
-                daily_units = plan['planned_units'] / 7
-                required_staff = round(daily_units / 100)
-                
-                for day in range(7):  # 1주일
-                    for shift in ['Day', 'Night']:
-                        if required_staff > 0:
-                            required_slots.append({
-                                'week': plan['period'],
-                                'day': day,
-                                'line_id': plan['line_id'],
-                                'shift': shift,
-                                'required': required_staff // 2
-                            })
+            # 2. 필요 인원 산정 (StubScheduler와 동일, 벡터화된 슬롯 테이블)
+            # 이후 루프에서는 행 dict 대신 컬럼별 리스트를 정수 인덱스로 참조
+            slots = _required_slots(mix_plan)
+            slot_week = slots['week'].tolist()
+            slot_day = slots['day'].tolist()
+            slot_line = slots['line_id'].tolist()
+            slot_shift = slots['shift'].tolist()
+            slot_required = slots['required'].tolist()
+            n_slots = len(slot_day)
             
-            # 3. CP-SAT 모델 생성
-            model = cp_model.CpModel()
-            
-            # 4. 변수 정의
-            # x[w, d, s, slot]: 작업자 w가 날짜 d, 교대 s, 슬롯에 근무하면 1
-            workers = workers_df['worker_id'].tolist()
-            days = range(7)
-            shifts = ['Day', 'Night']
-            
-            x = {}
-            for w in workers:
-                for d in days:
-                    for s in shifts:
-                        for slot_idx, slot in enumerate(required_slots):
-                            if slot['day'] == d and slot['shift'] == s:
-                                x[w, d, s, slot_idx] = model.NewBoolVar(f'x_{w}_{d}_{s}_{slot_idx}')
+            # 3. 사전 검증: 작업자는 하루 1교대, 주 5일까지만 근무하므로
+            # 일자별 필요 인원이 작업자 수를, 주간 필요 인원이 작업자 수 × 5를 넘으면 해가 없음
+            # (솔버가 실행 불가능을 증명하느라 제한 시간을 소모하지 않도록 바로 에러 반환)
+            day_required = np.bincount(slots['day'], weights=slots['required'], minlength=7)
+            if day_required.sum() > 5 * len(workers) or day_required.max() > len(workers):
+                return {
+                    "status": "error",
+                    "message": (
+                        f"필요 인원이 작업자 수로 배정 가능한 범위를 넘습니다 "
+                        f"(주간 필요 {int(day_required.sum())}명 / 최대 {5 * len(workers)}명, "
+                        f"일 최대 필요 {int(day_required.max())}명 / 작업자 {len(workers)}명)."
+                    ),
+                    "suggestion": "작업자 수를 늘리거나 필요 인원을 줄여보세요."
+                }
             
-            # 5. 제약 조건
+            # 4. 빠른 경로: 시급이 낮은 순 Greedy 배정이 비용 하한과 같으면 최적해이므로 솔버 생략
+            # (필요 인원이 없는 계획은 빈 배정 행렬이 그대로 최적해)
+            assigned = _greedy_min_wage(slot_day, slot_required, wages)
             
-            # 제약 1: 하루 최대 1교대
-            for w in workers:
-                for d in days:
-                    day_shifts = []
-                    for s in shifts:
-                        for slot_idx, slot in enumerate(required_slots):
-                            if slot['day'] == d and slot['shift'] == s:
-                                if (w, d, s, slot_idx) in x:
-                                    day_shifts.append(x[w, d, s, slot_idx])
-                    if day_shifts:
-                        model.Add(sum(day_shifts) <= 1)
+            # 5. CP-SAT 최적화
+            if assigned is None:
+                if not _HAS_ORTOOLS:
+                    return {
+                        "status": "error",
+                        "message": "OR-Tools가 설치되어 있지 않아 CP-SAT 스케줄링을 실행할 수 없습니다.",
+                        "suggestion": "pip install ortools 후 다시 시도하거나 Stub 모드를 사용하세요."
+                    }
+                assigned = self._solve_cpsat(worker_data, slot_day, slot_required)
+            if assigned is None:
+                return {
+                    "status": "error",
+                    "message": "최적해를 찾을 수 없습니다. 제약 조건을 완화해보세요.",
+                    "suggestion": "작업자 수를 늘리거나 필요 인원을 줄여보세요."
+                }
             
-            # 제약 2: 각 슬롯의 필요 인원 충족
-            for slot_idx, slot in enumerate(required_slots):
-                slot_assignments = []
-                for w in workers:
-                    if (w, slot['day'], slot['shift'], slot_idx) in x:
-                        slot_assignments.append(x[w, slot['day'], slot['shift'], slot_idx])
-                if slot_assignments:
-                    model.Add(sum(slot_assignments) >= slot['required'])
+            # 6. 결과 파싱
+            # 작업자별로 날짜 → 교대 → 슬롯 순서로 출력
+            shift_rank = {s: k for k, s in enumerate(SHIFTS)}
+            slot_order = np.array(sorted(
+                range(n_slots),
+                key=lambda i: (slot_day[i], shift_rank[slot_shift[i]], i)
+            ), dtype=np.int64)
             
-            # 제약 3: 주간 최대 근무시간 (간단화: 최대 5일 근무)
-            for w in workers:
-                worker_shifts = []
-                for d in days:
-                    for s in shifts:
-                        for slot_idx, slot in enumerate(required_slots):
-                            if slot['day'] == d and slot['shift'] == s:
-                                if (w, d, s, slot_idx) in x:
-                                    worker_shifts.append(x[w, d, s, slot_idx])
-                if worker_shifts:
-                    model.Add(sum(worker_shifts) <= 5)  # 주 5일 근무
+            # (작업자, 정렬된 슬롯) 행렬에서 배정된 칸의 좌표를 작업자 순으로 한 번에 추출
+            worker_row, slot_pos = np.nonzero(assigned[slot_order].T)
+            slot_sel = slot_order[slot_pos]
             
-            # 6. 목적 함수: 총 인건비 최소화
-            objective = []
-            for w_idx, w in enumerate(workers):
-                wage = workers_df[workers_df['worker_id'] == w]['wage_per_hour'].iloc[0]
-                for d in days:
-                    for s in shifts:
-                        for slot_idx, slot in enumerate(required_slots):
-                            if slot['day'] == d and slot['shift'] == s:
-                                if (w, d, s, slot_idx) in x:
-                                    # 8시간 근무 가정
-                                    objective.append(x[w, d, s, slot_idx] * wage * 8)
+            worker_ids = np.array(workers, dtype=object)[worker_row]
+            worker_names = worker_data['names'][worker_row]
+            worker_wages = wages[worker_row]
             
-            model.Minimize(sum(objective))
+            schedule = [
+                {
+                    'date': f"Week {slot_week[i]}, Day {slot_day[i]+1}",
+                    'line_id': slot_line[i],
+                    'shift': slot_shift[i],
+                    'worker_id': wid,
+                    'worker_name': wname
+                }
+                for i, wid, wname in zip(
+                    slot_sel.tolist(), worker_ids.tolist(), worker_names.tolist()
+                )
+            ]
             
-            # 7. 솔버 실행
-            solver = cp_model.CpSolver()
-            solver.parameters.max_time_in_seconds = 10.0  # 10초 타임아웃
-            status = solver.Solve(model)
+            # 8시간 근무 가정
+            total_cost = int(worker_wages.sum()) * 8
             
-            # 8. 결과 파싱
-            if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-                schedule = []
-                total_cost = 0
-                total_hours = 0
-                
-                for w in workers:
-                    for d in days:
-                        for s in shifts:
-                            for slot_idx, slot in enumerate(required_slots):
-                                if slot['day'] == d and slot['shift'] == s:
-                                    if (w, d, s, slot_idx) in x:
-                                        if solver.Value(x[w, d, s, slot_idx]) == 1:
-                                            worker_name = workers_df[workers_df['worker_id'] == w]['name'].iloc[0]
-                                            wage = workers_df[workers_df['worker_id'] == w]['wage_per_hour'].iloc[0]
-                                            
-                                            schedule.append({
-                                                'date': f"Week {slot['week']}, Day {d+1}",
-                                                'line_id': slot['line_id'],
-                                                'shift': s,
-                                                'worker_id': w,
-                                                'worker_name': worker_name
-                                            })
-                                            
-                                            total_cost += wage * 8
-                                            total_hours += 8
-                
-                # KPI 계산
-                return {
-                    "status": "success",
-                    "schedule": schedule,
-                    "kpi": {
-                        "total_cost": int(total_cost),
-                        "total_ot_hours": 0,  # MVP에서는 OT 계산 생략
-                        "night_bias_index": 0.5,  # 더미 값
-                        "fulfillment_rate": 100.0
-                    }
-                }
-            else:
-                return {
-                    "status": "error",
-                    "message": "최적해를 찾을 수 없습니다. 제약 조건을 완화해보세요.",
-                    "suggestion": "작업자 수를 늘리거나 필요 인원을 줄여보세요."
+            # KPI 계산
+            return {
+                "status": "success",
+                "schedule": schedule,
+                "kpi": {
+                    "total_cost": int(total_cost),
+                    "total_ot_hours": 0,  # MVP에서는 OT 계산 생략
+                    "night_bias_index": 0.5,  # 더미 값
+                    "fulfillment_rate": 100.0
                 }
+            }
             
         except Exception as e:
             return {
                 "status": "error",
                 "message": f"CP-SAT 스케줄링 실패: {str(e)}"
             }
+
+    def _solve_cpsat(self, worker_data: dict, slot_day: List[int], slot_required: List[int]):
+        """
+        CP-SAT 모델을 구성하고 풀어 (슬롯, 작업자) 배정 행렬을 반환합니다.
+        
+        시급이 같은 작업자는 목적 함수와 제약에서 서로 구분되지 않으므로
+        작업자별 불리언 대신 시급 그룹별 배정 인원(정수 변수)으로 모델링하고,
+        해를 구한 뒤 그룹 안에서 연차 순으로 작업자에게 다시 배분합니다.
+        
+        Args:
+            worker_data (dict): _worker_data()가 반환한 작업자 파생 데이터
+            slot_day (List[int]): 슬롯별 일자 인덱스
+            slot_required (List[int]): 슬롯별 필요 인원
+        
+        Returns:
+            np.ndarray or None: (슬롯, 작업자) 배정 불리언 행렬, 해를 찾지 못하면 None
+        """
+        n_slots = len(slot_day)
+        n_workers = len(worker_data['workers'])
+        
+        # 1. 시급 그룹 (그룹 안의 작업자는 연차 높은 순)
+        group_wages = worker_data['group_wages']
+        group_members = worker_data['group_members']
+        group_sizes = [len(m) for m in group_members]
+        
+        # 날짜별 슬롯 인덱스 (제약 조건에서 전체 슬롯을 다시 훑지 않도록 한 번만 그룹화)
+        slots_by_day = defaultdict(list)
+        for i, d in enumerate(slot_day):
+            slots_by_day[d].append(i)
+        day_slot_lists = list(slots_by_day.values())
+        
+        # 2. CP-SAT 모델 생성
+        model = cp_model.CpModel()
+        
+        # 3. 변수 정의
+        # n[g, i]: 시급 그룹 g에서 슬롯 i에 배정된 인원 (0 ~ min(그룹 인원, 필요 인원))
+        # 필요 인원이 0명인 슬롯은 배정할 이유가 없으므로 변수를 만들지 않음
+        n = {}
+        by_group = [[] for _ in group_wages]
+        by_slot = [[] for _ in range(n_slots)]
+        for i, required in enumerate(slot_required):
+            if required == 0:
+                continue
+            for g, size in enumerate(group_sizes):
+                var = model.NewIntVar(0, min(size, required), f'n_{g}_{i}')
+                n[g, i] = var
+                by_group[g].append(var)
+                by_slot[i].append(var)
+        
+        # 4. 제약 조건
+        
+        # 합계 식은 파이썬 sum() 대신 LinearExpr.Sum으로 한 번에 생성 (항마다 중간 식 객체를 만들지 않음)
+        
+        # 제약 1: 각 슬롯의 필요 인원 충족
+        # 인건비를 최소화하므로 필요 인원을 넘겨 배정하는 해는 최적이 아니어서 등식으로 두어도 최적해는 같음
+        for i, required in enumerate(slot_required):
+            if required:
+                model.Add(cp_model.LinearExpr.Sum(by_slot[i]) == required)
+        
+        # 제약 2: 하루 최대 1교대 -> 그룹별 하루 배정 인원은 그룹 인원 이하
+        for g, size in enumerate(group_sizes):
+            for day_slots in day_slot_lists:
+                day_vars = [n[g, i] for i in day_slots if (g, i) in n]
+                if day_vars:
+                    model.Add(cp_model.LinearExpr.Sum(day_vars) <= size)
+        
+        # 제약 3: 주간 최대 근무시간 (간단화: 최대 5일 근무) -> 그룹별 주간 배정 인원은 그룹 인원 × 5 이하
+        # 제약 2, 3을 만족하면 그룹 안에서 순환 배정으로 작업자별 제약을 항상 만족시킬 수 있음 (8. 해 복원 참고)
+        for g, size in enumerate(group_sizes):
+            if by_group[g]:
+                model.Add(cp_model.LinearExpr.Sum(by_group[g]) <= 5 * size)  # 주 5일 근무
+        
+        # 5. 목적 함수: 총 인건비 최소화 (8시간 근무 가정)
+        # 항마다 곱셈 식 객체를 만들지 않고 변수/계수 리스트를 WeightedSum으로 한 번에 전달
+        n_vars = list(n.values())
+        n_coeffs = [group_wages[g] * 8 for (g, i) in n.keys()]
+        model.Minimize(cp_model.LinearExpr.WeightedSum(n_vars, n_coeffs))
+        
+        # 6. 초기 해 힌트 (warm start)
+        # StubScheduler와 같은 Greedy 배정(연차 높은 순 Round-robin)을 그룹별 인원으로 집계하여 제공
+        # (힌트는 탐색 방향만 제시하며, 제약을 위반하더라도 솔버가 보정하며 계속 탐색함)
+        hint_order = worker_data['hint_order']
+        if len(hint_order) and n:
+            seat_slot = np.repeat(np.arange(n_slots), np.asarray(slot_required, dtype=np.int64))
+            seat_group = hint_order[np.arange(len(seat_slot)) % len(hint_order)]
+            hint = np.zeros((len(group_wages), n_slots), dtype=np.int64)
+            np.add.at(hint, (seat_group, seat_slot), 1)
+            for (g, i), var in n.items():
+                model.AddHint(var, min(int(hint[g, i]), group_sizes[g], slot_required[i]))
+        
+        # 7. 솔버 실행
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = 10.0  # 10초 타임아웃
+        # 병렬 포트폴리오 탐색 (CPU 코어 수보다 많으면 작업자끼리 시간을 나눠 써서 오히려 느려짐)
+        solver.parameters.num_search_workers = min(8, os.cpu_count() or 1)
+        solver.parameters.log_search_progress = False  # 탐색 로그 출력 안 함
+        solver.parameters.relative_gap_limit = 0.01  # 최적해와의 차이가 1% 이내이면 조기 종료
+        # presolve/탐색 파라미터는 기본값을 사용
+        # - cp_model_probing_level = 1: 작업자 40~400명 사례에서 풀이 시간과 비용이 기본값과 같음
+        # - optimize_with_core: 작업자 수가 적을 때 전체 탐색이 core 방식으로 바뀌어
+        #   같은 10초 안에 더 나쁜 해를 반환함 (병렬 탐색 시에는 포트폴리오의 core 작업자가 이미 담당)
+        status = solver.Solve(model)
+        
+        if status != cp_model.OPTIMAL and status != cp_model.FEASIBLE:
+            return None
+        
+        # 8. 해 복원: 그룹별 배정 인원을 작업자별 (슬롯, 작업자) 불리언 행렬로 변환
+        # 그룹마다 자리를 날짜 순으로 나열하고 그룹 작업자에게 순환 배정
+        # - 하루 배정 인원이 그룹 인원 이하이므로 같은 날 자리는 서로 다른 작업자에게 돌아감
+        # - 주간 배정 인원이 그룹 인원 × 5 이하이므로 작업자별 배정은 최대 5일
+        counts = np.zeros((len(group_wages), n_slots), dtype=np.int64)
+        if n:
+            keys = np.array(list(n.keys()), dtype=np.int64)
+            counts[keys[:, 0], keys[:, 1]] = np.fromiter(
+                (solver.Value(v) for v in n_vars), dtype=np.int64, count=len(n_vars)
+            )
+        slot_by_day = np.argsort(np.asarray(slot_day, dtype=np.int64), kind='stable')
+        assigned = np.zeros((n_slots, n_workers), dtype=bool)
+        for g, members in enumerate(group_members):
+            seat_slot = np.repeat(slot_by_day, counts[g, slot_by_day])
+            seat_worker = members[np.arange(len(seat_slot)) % len(members)]
+            assigned[seat_slot, seat_worker] = True
+        return assigned
@@ -0,0 +1,5 @@
+"""
+LineMind 백엔드 테스트 패키지
+
+backend 디렉토리에서 `python -m pytest`로 실행합니다.
+"""
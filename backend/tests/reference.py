@@ -0,0 +1,161 @@
+"""
+빠른 경로 검증용 참조 모델 모듈
+
+최적화/스케줄링 모듈의 빠른 경로(Greedy, 집계 모델)가 원래 CP-SAT 정식화와 같은 최소 비용을 내는지
+비교하기 위해, 작은 무작위 사례 생성기와 원래 정식화를 그대로 푸는 참조 모델을 제공합니다.
+"""
+
+import numpy as np
+from ortools.sat.python import cp_model
+from typing import Callable, Iterator, Optional
+
+
+def random_instances(make_instance: Callable[[np.random.Generator], tuple], count: int, seed: int = 0) -> Iterator[tuple]:
+    """
+    고정 시드 난수 생성기로 make_instance를 count번 호출하여 재현 가능한 무작위 사례를 만듭니다.
+
+    Args:
+        make_instance (Callable): 난수 생성기를 받아 사례 하나(튜플)를 반환하는 함수
+        count (int): 생성할 사례 수
+        seed (int): 난수 시드 (기본값: 0)
+
+    Returns:
+        Iterator[tuple]: 사례 튜플
+    """
+    rng = np.random.default_rng(seed)
+    for _ in range(count):
+        yield make_instance(rng)
+
+
+def solve_optimum(model: cp_model.CpModel) -> Optional[int]:
+    """
+    CP-SAT 모델을 풀어 최적성이 증명된 목적 함수 값을 반환합니다.
+
+    Returns:
+        int or None: 최소 목적 함수 값, 최적해를 증명하지 못하면(해가 없는 경우 포함) None
+    """
+    solver = cp_model.CpSolver()
+    solver.parameters.max_time_in_seconds = 10.0
+    if solver.Solve(model) != cp_model.OPTIMAL:
+        return None
+    return int(solver.ObjectiveValue())
+
+
+def mix_instance(rng: np.random.Generator) -> tuple:
+    """
+    생산 믹스 검증용 작은 무작위 사례를 만듭니다.
+
+    Returns:
+        tuple: (주간 수요 (모델 수, 4), 라인별 주간 용량, 생산 가능 여부 (라인 수, 모델 수),
+            (라인, 도착 모델)별 체인지오버 비용)
+    """
+    n_lines, n_models, n_weeks = int(rng.integers(2, 5)), int(rng.integers(1, 4)), 4
+    weekly_cap = rng.integers(5, 15, n_lines) * 700
+    eligible = rng.random((n_lines, n_models)) < 0.6
+    # 모든 모델이 적어도 한 라인에서 생산 가능하도록 보장
+    eligible[rng.integers(0, n_lines, n_models), np.arange(n_models)] = True
+    weekly = rng.integers(0, 8000, (n_models, n_weeks))
+    changeover_cost = rng.integers(0, 5, (n_lines, n_models)) * 10000
+    return weekly, weekly_cap, eligible, changeover_cost
+
+
+def mix_cost(
+    weekly: np.ndarray,
+    weekly_cap: np.ndarray,
+    eligible: np.ndarray,
+    changeover_cost: np.ndarray
+) -> Optional[int]:
+    """
+    MilpOptimizer와 같은 정식화(라인당 주간 단일 모델, 수요 충족, 체인지오버)의 최소 비용을 구합니다.
+
+    Returns:
+        int or None: 최소 비용 (생산 단가 1000원/대 + 체인지오버 비용), 해가 없으면 None
+    """
+    n_lines, n_models = eligible.shape
+    n_weeks = weekly.shape[1]
+    model = cp_model.CpModel()
+
+    Q, Y = {}, {}
+    for li in range(n_lines):
+        for mi in np.flatnonzero(eligible[li]).tolist():
+            for w in range(n_weeks):
+                Q[li, mi, w] = model.NewIntVar(0, int(weekly_cap[li]), f'Q_{li}_{mi}_{w}')
+                Y[li, mi, w] = model.NewBoolVar(f'Y_{li}_{mi}_{w}')
+                model.Add(Q[li, mi, w] == 0).OnlyEnforceIf(Y[li, mi, w].Not())
+
+    for li in range(n_lines):
+        for w in range(n_weeks):
+            line_vars = [Y[key] for key in Y if key[0] == li and key[2] == w]
+            if line_vars:
+                model.AddAtMostOne(line_vars)
+    for mi in range(n_models):
+        for w in range(n_weeks):
+            model.Add(sum(Q[key] for key in Q if key[1] == mi and key[2] == w) >= int(weekly[mi, w]))
+
+    switch_cost = []
+    for (li, mi, w), y in Y.items():
+        if w > 0:
+            z = model.NewBoolVar(f'Z_{li}_{mi}_{w}')
+            model.Add(z >= y - Y[li, mi, w - 1])
+            switch_cost.append(int(changeover_cost[li, mi]) * z)
+
+    model.Minimize(1000 * sum(Q.values()) + sum(switch_cost))
+    return solve_optimum(model)
+
+
+def schedule_instance(rng: np.random.Generator) -> tuple:
+    """
+    인력 스케줄링 검증용 작은 무작위 사례를 만듭니다.
+
+    시급은 50% 이상 차이 나는 세 단계 중에서 고르고 필요 인원 합계는 16명 이하로 두어,
+    작업자 한 명만 바꿔도 비용이 1% 넘게 달라지도록 합니다.
+    (CpsatScheduler의 1% 갭 허용치 안에서 최적이 아닌 해가 반환되지 않음)
+
+    Returns:
+        tuple: (슬롯별 일자 리스트, 슬롯별 필요 인원 리스트, 작업자별 시급 배열)
+    """
+    n_days = int(rng.integers(2, 5))
+    slot_day = np.repeat(np.arange(n_days), 2).tolist()  # 하루 2교대
+    slot_required = rng.integers(0, 3, len(slot_day)).tolist()
+    wages = rng.choice([10000, 15000, 22500], int(rng.integers(3, 7)))
+    return slot_day, slot_required, wages
+
+
+def schedule_cost(slot_day: list, slot_required: list, wages: np.ndarray, max_days: int = 5) -> Optional[int]:
+    """
+    작업자별 불리언 변수로 만든 원래 스케줄링 정식화(필요 인원, 하루 1교대, 주 max_days일)의 최소 시급 합계를 구합니다.
+
+    Returns:
+        int or None: 배정된 작업자 시급의 최소 합계, 해가 없으면 None
+    """
+    n_workers = len(wages)
+    model = cp_model.CpModel()
+    x = {}
+    for i, required in enumerate(slot_required):
+        if required:
+            for w in range(n_workers):
+                x[w, i] = model.NewBoolVar(f'x_{w}_{i}')
+
+    for i, required in enumerate(slot_required):
+        if required:
+            model.Add(sum(x[w, i] for w in range(n_workers)) >= required)
+    for w in range(n_workers):
+        for d in set(slot_day):
+            day_vars = [x[w, i] for i in range(len(slot_day)) if slot_day[i] == d and (w, i) in x]
+            if day_vars:
+                model.AddAtMostOne(day_vars)
+        model.Add(sum(v for (ww, i), v in x.items() if ww == w) <= max_days)
+
+    model.Minimize(sum(int(wages[w]) * v for (w, i), v in x.items()))
+    return solve_optimum(model)
+
+
+def check_assignment(assigned: np.ndarray, slot_day: list, slot_required: list, max_days: int = 5) -> None:
+    """
+    (슬롯, 작업자) 배정 행렬이 필요 인원, 하루 1교대, 주간 최대 근무일 제약을 만족하는지 확인합니다.
+    """
+    assert (assigned.sum(axis=1) == np.asarray(slot_required)).all()
+    slot_day_arr = np.asarray(slot_day)
+    for d in np.unique(slot_day_arr).tolist():
+        assert (assigned[slot_day_arr == d].sum(axis=0) <= 1).all()
+    assert (assigned.sum(axis=0) <= max_days).all()
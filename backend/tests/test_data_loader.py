@@ -0,0 +1,17 @@
+"""
+데이터 로더 모듈 테스트
+"""
+
+import pytest
+
+from data_loader import DataLoader
+
+
+@pytest.mark.parametrize("content", ["", "\n\n"])
+def test_load_csv_reports_empty_file(tmp_path, content):
+    """
+    빈 CSV 파일은 파싱 엔진(pyarrow/C)과 관계없이 같은 에러 메시지로 보고되는지 확인합니다.
+    """
+    (tmp_path / 'empty.csv').write_text(content)
+    with pytest.raises(ValueError, match="빈 CSV 파일입니다"):
+        DataLoader(str(tmp_path)).load_csv('empty.csv', ['line_id'])
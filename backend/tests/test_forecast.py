@@ -0,0 +1,40 @@
+"""
+생산량 예측 모듈 테스트
+"""
+
+from data_loader import DataLoader
+from forecast import SimpleForecaster
+
+
+def test_cached_forecast_is_not_shared_between_callers():
+    """
+    캐시된 예측을 반환할 때 호출자마다 새 응답을 받아, 한 호출자가 결과를 수정해도
+    다음 호출 결과가 바뀌지 않는지 확인합니다.
+    """
+    forecaster = SimpleForecaster(DataLoader())
+    first = forecaster.run_forecast_all_models()
+    assert first['status'] == 'success'
+    model = next(iter(first['forecasts']))
+    expected = [dict(row) for row in first['forecasts'][model]]
+
+    first['forecasts'][model][0]['forecast_units'] = -1
+    first['forecasts'][model].clear()
+
+    assert forecaster.run_forecast_all_models()['forecasts'][model] == expected
+
+
+def test_loader_invalidate_clears_forecast_cache():
+    """
+    DataLoader.invalidate()를 호출하면 예측 캐시도 무효화되어 다시 계산하는지 확인합니다.
+    """
+    loader = DataLoader()
+    forecaster = SimpleForecaster(loader)
+    forecaster.run_forecast_all_models()
+    cached = forecaster._forecast_cache
+
+    forecaster.run_forecast_all_models()
+    assert forecaster._forecast_cache is cached
+
+    loader.invalidate()
+    forecaster.run_forecast_all_models()
+    assert forecaster._forecast_cache is not cached
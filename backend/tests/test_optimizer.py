@@ -0,0 +1,38 @@
+"""
+생산 믹스 최적화 모듈 테스트
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ortools")
+
+from optimizer import _single_model_plan
+from tests.reference import random_instances, mix_instance, mix_cost
+
+
+def test_single_model_plan_matches_reference():
+    """
+    _single_model_plan이 계획을 반환한 사례마다 계획이 제약(용량, 생산 가능 라인, 라인당 단일 모델, 수요)을
+    만족하고 그 비용(1000 * 생산량, 체인지오버 없음)이 원래 정식화의 최소 비용과 같은지 확인합니다.
+    """
+    checked = 0
+    for weekly, weekly_cap, eligible, changeover_cost in random_instances(mix_instance, 40):
+        lines_for_model = [np.flatnonzero(eligible[:, mi]).tolist() for mi in range(weekly.shape[0])]
+        plan = _single_model_plan(weekly, weekly_cap, lines_for_model)
+        if plan is None:
+            continue
+        li_sel, mi_sel, w_sel, planned = plan
+
+        assert (planned <= weekly_cap[li_sel]).all()
+        assert eligible[li_sel, mi_sel].all()
+        for li in np.unique(li_sel).tolist():
+            assert len(np.unique(mi_sel[li_sel == li])) == 1
+        produced = np.zeros_like(weekly)
+        np.add.at(produced, (mi_sel, w_sel), planned)
+        assert (produced == weekly).all()
+
+        assert 1000 * int(planned.sum()) == mix_cost(weekly, weekly_cap, eligible, changeover_cost)
+        checked += 1
+
+    assert checked > 0
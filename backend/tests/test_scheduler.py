@@ -0,0 +1,81 @@
+"""
+인력 스케줄링 모듈 테스트
+"""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ortools")
+
+from scheduler import CpsatScheduler, _greedy_min_wage, _to_soa
+from tests.reference import random_instances, schedule_instance, schedule_cost, check_assignment
+
+
+def test_greedy_min_wage_matches_reference():
+    """
+    _greedy_min_wage가 배정을 반환한 사례마다 배정이 제약을 만족하고
+    시급 합계가 원래 작업자별 정식화의 최소 비용과 같은지 확인합니다.
+    """
+    checked = 0
+    for slot_day, slot_required, wages in random_instances(schedule_instance, 40):
+        assigned = _greedy_min_wage(slot_day, slot_required, wages)
+        if assigned is None:
+            continue
+        check_assignment(assigned, slot_day, slot_required)
+        assert int((assigned * wages).sum()) == schedule_cost(slot_day, slot_required, wages)
+        checked += 1
+
+    assert checked > 0
+
+
+def test_wage_group_model_matches_reference():
+    """
+    시급 그룹별 인원으로 모델링한 CpsatScheduler._solve_cpsat의 해를 작업자별로 복원한 배정이
+    제약을 만족하고 시급 합계가 원래 작업자별 정식화의 최소 비용과 같은지 확인합니다.
+    해가 없는 사례는 두 모델 모두 해가 없어야 합니다.
+    """
+    scheduler = CpsatScheduler()
+    for slot_day, slot_required, wages in random_instances(schedule_instance, 30, seed=1):
+        # _worker_data()와 같은 형식의 작업자 파생 데이터 (작업자 순서를 연차 순으로 간주)
+        group_wages = sorted(set(wages.tolist()))
+        group_index = {g: k for k, g in enumerate(group_wages)}
+        worker_data = {
+            'workers': [f'W{k}' for k in range(len(wages))],
+            'group_wages': group_wages,
+            'group_members': [np.flatnonzero(wages == g) for g in group_wages],
+            'hint_order': np.array([group_index[v] for v in wages.tolist()], dtype=np.int64),
+        }
+
+        assigned = scheduler._solve_cpsat(worker_data, slot_day, slot_required)
+        expected = schedule_cost(slot_day, slot_required, wages)
+        if expected is None:
+            assert assigned is None
+            continue
+        check_assignment(assigned, slot_day, slot_required)
+        assert int((assigned * wages).sum()) == expected
+
+
+def test_to_soa_keeps_period_labels():
+    """
+    _to_soa가 "W1" 같은 문자열 주차는 그대로 두고 정수 값의 실수 주차는 정수로 변환하는지 확인합니다.
+    """
+    mp = _to_soa([
+        {'period': 'W1', 'line_id': 'L1', 'planned_units': 700},
+        {'period': 2.0, 'line_id': 'L2', 'planned_units': 1400},
+    ])
+    assert mp['period'].tolist() == ['W1', 2]
+    assert mp['planned_units'].tolist() == [700.0, 1400.0]
+
+
+@pytest.mark.parametrize("period, planned_units", [
+    (1, float('nan')),
+    (float('nan'), 700),
+    (None, 700),
+    (1.5, 700),
+])
+def test_to_soa_rejects_invalid_plan(period, planned_units):
+    """
+    결측치 또는 정수가 아닌 주차, 결측치인 계획 생산량은 ValueError로 거부하는지 확인합니다.
+    """
+    with pytest.raises(ValueError):
+        _to_soa([{'period': period, 'line_id': 'L1', 'planned_units': planned_units}])